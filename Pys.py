@@ -5,428 +5,2451 @@ Real-time translation dengan caching, multi-file support, dan error handling
 """
 
 import ast
+import builtins
+import codeop
+import contextlib
+import dis
+import functools
+import gc
+import io
+import itertools
+import keyword
+import linecache
 import os
 import sys
 import types
 import time
 import hashlib
+import importlib.machinery
 import importlib.util
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+import marshal
+import threading
+import tokenize
+import weakref
+from typing import Dict, List, Any, Optional, Iterator, Callable, NamedTuple
+from collections import OrderedDict, defaultdict
 import traceback
 import re
 
+# asyncio, argparse, cProfile/pstats dan concurrent.futures di-import di dalam
+# fitur yang memakainya: import-nya mendominasi startup runtime
+
+# Sentinel untuk membedakan cache miss dari value falsy ('' / None)
+_MISSING = object()
+_NO_IMPORTS = frozenset()
+
+def _split_lines(code: str) -> List[str]:
+    """Split seperti io.StringIO.readline (hanya '\\n', newline dipertahankan)"""
+    return io.StringIO(code).readlines()
+
+def _imported_modules(code: types.CodeType, package: Optional[str]) -> set:
+    """Nama absolut module dari semua IMPORT_NAME di code object (rekursif)"""
+    names = set()
+    constants = [None, None]
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == 'LOAD_CONST':
+            constants = [constants[1], instruction.argval]
+        elif instruction.opname == 'IMPORT_NAME':
+            level, fromlist = constants
+            name = instruction.argval
+            if isinstance(level, int) and level > 0:
+                try:
+                    name = importlib.util.resolve_name('.' * level + name, package)
+                except (ImportError, ValueError):
+                    continue
+            names.add(name)
+            # 'from paket import alat' bisa berarti submodule paket.alat
+            for item in fromlist or ():
+                names.add(f"{name}.{item}" if name else item)
+    
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= _imported_modules(constant, package)
+    return names
+
+def _line_count(text: str) -> int:
+    """Jumlah physical line dalam sebuah chunk (tidak kosong)"""
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
+
+def _hash_file(path: str):
+    """sha256 raw bytes file, dibaca per block 1 MiB"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest
+
+def _code_with_filename(code: types.CodeType, filename: str) -> types.CodeType:
+    """Code object (termasuk code nested di co_consts) dengan co_filename lain"""
+    if code.co_filename == filename:
+        return code
+    consts = tuple(_code_with_filename(const, filename) if isinstance(const, types.CodeType) else const
+                   for const in code.co_consts)
+    return code.replace(co_filename=filename, co_consts=consts)
+
+def _estimate_size(obj: Any) -> int:
+    """Estimasi ukuran object dalam bytes (shallow + satu level container)"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items())
+    return size
+
 class MemoryAwareCache:
-    """LRU Cache dengan memory management"""
-    def __init__(self, max_size: int = 10000):
-        self.cache = {}
-        self.access_count = defaultdict(int)
-        self.access_time = {}
+    """LRU Cache dengan memory management (entry dan byte budget)"""
+    def __init__(self, max_size: int = 10000, max_bytes: Optional[int] = None):
+        # key -> (value, estimated_size), urutan = LRU ke MRU
+        self.cache = OrderedDict()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
     
-    def get(self, key: str) -> Optional[Any]:
-        if key in self.cache:
-            self.access_count[key] += 1
-            self.access_time[key] = time.time()
-            return self.cache[key]
-        return None
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        entry = self.cache.get(key)
+        if entry is None:
+            return default
+        self.cache.move_to_end(key)
+        return entry[0]
     
     def set(self, key: str, value: Any):
-        if len(self.cache) >= self.max_size:
-            # LRU eviction - remove oldest accessed
-            oldest_key = min(self.access_time, key=self.access_time.get)
-            del self.cache[oldest_key]
-            del self.access_count[oldest_key]
-            del self.access_time[oldest_key]
+        size = _estimate_size(key) + _estimate_size(value)
+        old_entry = self.cache.pop(key, None)
+        if old_entry is not None:
+            self.current_bytes -= old_entry[1]
+        
+        self.cache[key] = (value, size)
+        self.current_bytes += size
         
-        self.cache[key] = value
-        self.access_count[key] = 1
-        self.access_time[key] = time.time()
+        # LRU eviction - remove oldest accessed sampai masuk budget
+        while self.cache and (
+            len(self.cache) > self.max_size
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, (_, evicted_size) = self.cache.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
     
     def clear(self):
         self.cache.clear()
-        self.access_count.clear()
-        self.access_time.clear()
+        self.current_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self.cache)
+
+class LazyModule(types.ModuleType):
+    """Module placeholder yang baru di-import saat attribute pertama diakses"""
+    def __init__(self, alias: str, module_name: str):
+        super().__init__(alias)
+        self.__dict__['_lazy_target'] = module_name
+    
+    def _load(self) -> types.ModuleType:
+        module = importlib.import_module(self.__dict__['_lazy_target'])
+        # Copy namespace agar akses berikutnya tidak lewat __getattr__ lagi
+        self.__dict__.update(module.__dict__)
+        self.__dict__['_lazy_module'] = module
+        return module
+    
+    def __getattr__(self, name: str) -> Any:
+        module = self.__dict__.get('_lazy_module') or self._load()
+        return getattr(module, name)
+    
+    def __dir__(self) -> List[str]:
+        return dir(self.__dict__.get('_lazy_module') or self._load())
+    
+    def __repr__(self) -> str:
+        state = 'loaded' if '_lazy_module' in self.__dict__ else 'lazy'
+        return f"<module {self.__dict__['_lazy_target']!r} ({state})>"
+
+def lazy_module(alias: str, module_name: str) -> types.ModuleType:
+    """Module asli jika sudah di-import, selain itu LazyModule"""
+    module = sys.modules.get(module_name)
+    return module if module is not None else LazyModule(alias, module_name)
+
+class _Flight:
+    """Satu komputasi miss yang sedang berjalan (ditunggu thread lain)"""
+    __slots__ = ('event', 'value', 'error')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+class ShardedMemoryCache:
+    """Thread-safe LRU: beberapa MemoryAwareCache dengan lock per shard
+    
+    Hit hanya mengunci shard milik key (kontensi dibagi per shard), dan
+    get_or_compute menjalankan miss secara single-flight: thread lain yang
+    meminta key yang sama menunggu hasil komputasi pertama.
+    """
+    def __init__(self, max_size: int = 10000, max_bytes: Optional[int] = None, shards: int = 16):
+        self.shards = [
+            MemoryAwareCache(max(1, max_size // shards), max_bytes // shards if max_bytes is not None else None)
+            for _ in range(shards)
+        ]
+        self.locks = [threading.Lock() for _ in range(shards)]
+        self.in_flight = [{} for _ in range(shards)]
+    
+    def _index(self, key: Any) -> int:
+        return hash(key) % len(self.shards)
+    
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        index = self._index(key)
+        with self.locks[index]:
+            return self.shards[index].get(key, default)
+    
+    def set(self, key: str, value: Any):
+        index = self._index(key)
+        with self.locks[index]:
+            self.shards[index].set(key, value)
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return (value, computed) - computed=True hanya untuk thread yang menghitung"""
+        index = self._index(key)
+        with self.locks[index]:
+            value = self.shards[index].get(key, _MISSING)
+            if value is not _MISSING:
+                return value, False
+            flight = self.in_flight[index].get(key)
+            leader = flight is None
+            if leader:
+                flight = self.in_flight[index][key] = _Flight()
+        
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, False
+        
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.locks[index]:
+                if flight.error is None:
+                    self.shards[index].set(key, flight.value)
+                del self.in_flight[index][key]
+            flight.event.set()
+        return flight.value, True
+    
+    def clear(self):
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                shard.clear()
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+    
+    @property
+    def current_bytes(self) -> int:
+        return sum(shard.current_bytes for shard in self.shards)
+    
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self.shards)
+
+class _CounterSlot:
+    """Penanda umur counter satu thread (dipegang threading.local)"""
+    __slots__ = ('__weakref__',)
+
+class ThreadLocalCounters:
+    """Stats counter per thread (tanpa lost update), dijumlahkan oleh copy()
+    
+    `stats[key] += 1` membaca dan menulis counter milik thread sendiri,
+    jadi tidak butuh lock di hot path. Counter thread yang sudah selesai
+    dilipat ke `_retired` saat slot thread-local-nya dilepas, jadi memory
+    dan biaya copy() sebanding dengan thread yang masih hidup.
+    """
+    def __init__(self, keys):
+        self._keys = tuple(keys)
+        self._local = threading.local()
+        # id(slot) -> counters, hanya thread yang masih hidup
+        self._live = {}
+        self._retired = dict.fromkeys(self._keys, 0)
+        # RLock: finalizer bisa jalan di thread yang sedang memegang lock
+        self._lock = threading.RLock()
+    
+    def _counters(self) -> dict:
+        counters = getattr(self._local, 'counters', None)
+        if counters is None:
+            counters = dict.fromkeys(self._keys, 0)
+            slot = _CounterSlot()
+            with self._lock:
+                self._live[id(slot)] = counters
+            # Tanpa referensi ke self supaya finalizer tidak menahan objek ini
+            weakref.finalize(slot, ThreadLocalCounters._retire,
+                             self._lock, self._live, self._retired, id(slot))
+            self._local.slot = slot
+            self._local.counters = counters
+        return counters
+    
+    @staticmethod
+    def _retire(lock, live: dict, retired: dict, slot_id: int):
+        with lock:
+            counters = live.pop(slot_id, None)
+            if counters is not None:
+                for key, value in counters.items():
+                    retired[key] = retired.get(key, 0) + value
+    
+    def __getitem__(self, key: str) -> int:
+        return self._counters()[key]
+    
+    def __setitem__(self, key: str, value: int):
+        self._counters()[key] = value
+    
+    def copy(self) -> dict:
+        """Total semua thread (interface sama dengan dict.copy)"""
+        with self._lock:
+            totals = dict(self._retired)
+            for counters in self._live.values():
+                for key in self._keys:
+                    totals[key] += counters.get(key, 0)
+        return totals
+
+class ModuleRegistry:
+    """Registry module live: LRU strong ref terbatas, sisanya weak ref
+    
+    Module di luar budget (entry/byte) hanya dipegang weak: tetap bisa
+    dipakai ulang selama masih direferensikan di tempat lain (mis.
+    sys.modules), selain itu dilepas ke garbage collector.
+    """
+    def __init__(self, max_modules: int = 100, max_bytes: Optional[int] = None):
+        # path -> (module, estimated_size), urutan = LRU ke MRU
+        self.resident = OrderedDict()
+        self.live = weakref.WeakValueDictionary()
+        self.max_modules = max_modules
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+    
+    def get(self, path: str, default: Any = None) -> Optional[types.ModuleType]:
+        module = self.live.get(path)
+        if module is None:
+            return default
+        if path in self.resident:
+            self.resident.move_to_end(path)
+        else:
+            # Masih hidup lewat referensi lain: jadikan resident lagi
+            self.set(path, module)
+        return module
+    
+    def set(self, path: str, module: types.ModuleType):
+        self.discard(path)
+        size = _estimate_size(module.__dict__)
+        self.resident[path] = (module, size)
+        self.live[path] = module
+        self.current_bytes += size
+        
+        while len(self.resident) > 1 and (
+            len(self.resident) > self.max_modules
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, (_, evicted_size) = self.resident.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+    
+    def discard(self, path: str):
+        entry = self.resident.pop(path, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+        self.live.pop(path, None)
+    
+    def clear(self):
+        self.resident.clear()
+        self.live.clear()
+        self.current_bytes = 0
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.live
+    
+    def __getitem__(self, path: str) -> types.ModuleType:
+        module = self.get(path)
+        if module is None:
+            raise KeyError(path)
+        return module
+    
+    def items(self) -> List[tuple[str, types.ModuleType]]:
+        return list(self.live.items())
+    
+    def __len__(self) -> int:
+        return len(self.live)
+
+# Naikkan setiap kali output translator berubah agar disk cache lama invalid
+TRANSLATOR_VERSION = 7
+CACHE_DIR_NAME = '__pyscache__'
+CACHE_MAGIC = b'PYSC\x01\r\n'
+PYS_EXTENSIONS = ('.pys',)
+MAX_CACHED_LINE_LENGTH = 1024
+MAX_CACHED_SNIPPET_LENGTH = 64 * 1024
+SNIPPET_CACHE_MAX_BYTES = 16 * 1024 * 1024
+PROJECT_MAIN_FILES = ('main.pys', 'app.pys', 'run.pys', '__main__.pys',
+                      'main.py', 'app.py', 'run.py', '__main__.py')
+BUILD_MANIFEST_NAME = '.pys-build.json'
+BUILD_SOURCEMAP_NAME = 'pys-sourcemap.json'
+
+# Module yang tersedia sebagai global di runtime tanpa import (alias -> module)
+MODULE_ALIASES = {
+    'statistik': 'statistics',
+    'sqlite3': 'sqlite3',
+    'os': 'os',
+    'sys': 'sys',
+    'time': 'time',
+    'math': 'math',
+    'random': 'random',
+    'json': 'json',
+    're': 're',
+}
+
+# Token yang tidak menentukan posisi (keyword/call/attribute) sebuah NAME
+_LAYOUT_TOKENS = frozenset({tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT})
+# Mulai 3.12 isi replacement field f-string muncul sebagai token biasa
+_FSTRING_TOKENIZED = sys.version_info >= (3, 12)
+_STRING_PREFIX = re.compile(r'[A-Za-z]*')
+_OPENING_BRACKETS = frozenset('([{')
+_CLOSING_BRACKETS = frozenset(')]}')
+_LEADING_WORD = re.compile(r'[^\W\d]\w*')
+
+class _ClassScope:
+    """Body class yang sedang terbuka, dilacak dari indentasi statement
+    
+    Method dan atribut class diakses lewat obj.nama (tidak di-translate),
+    jadi nama yang didefinisikan langsung di body class juga dibiarkan,
+    termasuk pemakaian nama itu di statement body class berikutnya.
+    """
+    __slots__ = ('stack', '_snapshot')
+    
+    def __init__(self):
+        # [indent header class, indent body (None sampai statement pertama), nama member]
+        self.stack = []
+        self._snapshot = ()
+    
+    def enter(self, indent: int, word: Optional[str]) -> bool:
+        """Statement baru (word = kata Python pertama); True jika langsung di body class"""
+        stack = self.stack
+        while stack and indent <= stack[-1][0]:
+            stack.pop()
+            self._snapshot = None
+        in_body = False
+        if stack:
+            if stack[-1][1] is None:
+                stack[-1][1] = indent
+                self._snapshot = None
+            in_body = indent == stack[-1][1]
+        if word == 'class':
+            stack.append([indent, None, frozenset()])
+            self._snapshot = None
+        return in_body
+    
+    def bind(self, name: str):
+        """Nama didefinisikan di body class paling dalam"""
+        entry = self.stack[-1]
+        if name not in entry[2]:
+            entry[2] = entry[2] | {name}
+            self._snapshot = None
+    
+    def is_member(self, name: str) -> bool:
+        return bool(self.stack) and name in self.stack[-1][2]
+    
+    def snapshot(self) -> tuple:
+        # Di-cache sampai state berubah: dipanggil sekali per chunk
+        if self._snapshot is None:
+            self._snapshot = tuple(tuple(entry) for entry in self.stack)
+        return self._snapshot
+    
+    @classmethod
+    def restore(cls, snapshot: tuple) -> '_ClassScope':
+        scope = cls()
+        scope.stack = [list(entry) for entry in snapshot]
+        scope._snapshot = snapshot
+        return scope
+
+# Tabel kata Indonesia -> Python. Sengaja list of pairs (bukan dict literal)
+# supaya kata dobel terdeteksi saat index dibangun, bukan diam-diam tertimpa.
+KEYWORD_ENTRIES = (
+    # Basic I/O - Multiple aliases dengan prioritas
+    ('cetak', 'print'), ('tampilkan', 'print'), ('tulis', 'print'),
+    ('masukan', 'input'), ('input_pengguna', 'input'), ('ambil_input', 'input'), ('tanya', 'input'),
+
+    # Data Type Conversion
+    ('ke_angka', 'int'), ('ke_integer', 'int'), ('ke_bilangan', 'int'),
+    ('ke_desimal', 'float'), ('ke_float', 'float'), ('ke_pecahan', 'float'),
+    ('ke_teks', 'str'), ('ke_string', 'str'), ('ke_kata', 'str'),
+    ('ke_boolean', 'bool'), ('ke_bool', 'bool'),
+
+    # String Operations
+    ('panjang', 'len'), ('ukuran', 'len'), ('hitung', 'len'), ('banyak', 'len'),
+    ('gabung', 'join'), ('sambung', 'join'), ('satukan', 'join'),
+    ('pisah', 'split'), ('bagi', 'split'), ('potong', 'split'), ('pecah', 'split'),
+    ('ganti', 'replace'), ('ubah', 'replace'), ('tukar', 'replace'), ('substitusi', 'replace'),
+    ('cari', 'find'), ('temukan', 'find'), ('lokasi', 'find'), ('posisi', 'find'),
+    ('huruf_besar', 'upper'), ('kapital', 'upper'), ('besar_semua', 'upper'),
+    ('huruf_kecil', 'lower'), ('kecil_semua', 'lower'), ('lowercase', 'lower'),
+    ('awalan', 'startswith'), ('dimulai_dengan', 'startswith'),
+    ('akhiran', 'endswith'), ('diakhiri_dengan', 'endswith'),
+    ('hapus_spasi', 'strip'), ('trim', 'strip'), ('bersihkan', 'strip'),
+
+    # List Operations
+    ('daftar', 'list'), ('buat_daftar', 'list'), ('array', 'list'), ('senarai', 'list'),
+    ('tambah', 'append'), ('masukkan', 'append'), ('sisipkan', 'insert'),
+    ('hapus', 'remove'), ('buang', 'remove'), ('hilangkan', 'pop'), ('keluarkan', 'pop'),
+    ('urutkan', 'sort'), ('sortir', 'sort'), ('susun', 'sort'), ('atur', 'sorted'),
+    ('balik', 'reverse'), ('kebalikan', 'reverse'), ('terbalik', 'reversed'),
+    ('salin', 'copy'), ('duplikat', 'copy'), ('kopi', 'copy'),
+    ('kosongkan', 'clear'), ('bersihkan_daftar', 'clear'),
+    ('hitung_item', 'count'), ('jumlah_item', 'count'),
+
+    # Dictionary Operations
+    ('kamus', 'dict'), ('dictionary', 'dict'), ('buat_kamus', 'dict'), ('peta', 'dict'),
+    ('kunci', 'keys'), ('semua_kunci', 'keys'), ('daftar_kunci', 'keys'),
+    ('nilai', 'values'), ('semua_nilai', 'values'), ('daftar_nilai', 'values'),
+    ('item', 'items'), ('semua_item', 'items'), ('pasangan', 'items'),
+    ('ambil', 'get'), ('dapatkan', 'get'), ('cari_nilai', 'get'),
+    ('perbarui', 'update'), ('gabung_kamus', 'update'),
+
+    # File Operations
+    ('buka_file', 'open'), ('baca_file', 'open'), ('akses_file', 'open'),
+    ('tutup_file', 'close'), ('simpan_file', 'write'),
+
+    # Math Operations
+    ('maksimum', 'max'), ('terbesar', 'max'), ('paling_besar', 'max'),
+    ('minimum', 'min'), ('terkecil', 'min'), ('paling_kecil', 'min'),
+    ('jumlah', 'sum'), ('total', 'sum'), ('tambah_semua', 'sum'), ('sigma', 'sum'),
+    ('rata_rata', 'statistics.mean'), ('mean', 'statistics.mean'), ('rerata', 'statistics.mean'),
+    ('median', 'statistics.median'), ('nilai_tengah', 'statistics.median'),
+    ('bulat', 'round'), ('pembulatan', 'round'), ('bulatkan', 'round'),
+    ('absolut', 'abs'), ('mutlak', 'abs'), ('nilai_absolut', 'abs'),
+    ('pangkat', 'pow'), ('eksponen', 'pow'), ('kuadrat', 'pow'),
+
+    # Range and Iteration
+    ('rentang', 'range'), ('jangkauan', 'range'), ('dari_sampai', 'range'),
+    ('enumerasi', 'enumerate'), ('enum', 'enumerate'), ('nomori', 'enumerate'),
+    ('zip_data', 'zip'), ('gabung_data', 'zip'), ('pasangkan', 'zip'),
+
+    # Type Checking
+    ('tipe', 'type'), ('jenis', 'type'), ('type_data', 'type'),
+    ('adalah_angka', 'isinstance'), ('adalah_teks', 'isinstance'),
+
+    # Control Flow Keywords
+    ('jika', 'if'), ('kalau', 'if'), ('bila', 'if'), ('andai', 'if'),
+    ('atau_jika', 'elif'), ('atau_kalau', 'elif'), ('else_if', 'elif'),
+    ('selain_itu', 'else'), ('lainnya', 'else'), ('jika_tidak', 'else'),
+    ('untuk', 'for'), ('setiap', 'for'), ('tiap', 'for'),
+    ('selama', 'while'), ('ketika', 'while'), ('saat', 'while'),
+    ('dalam', 'in'), ('di', 'in'), ('pada', 'in'), ('ada_dalam', 'in'),
+    ('keluar', 'break'), ('berhenti', 'break'), ('stop', 'break'),
+    ('lanjut', 'continue'), ('skip', 'continue'), ('lewati', 'continue'),
+    ('kembali', 'return'), ('kembalikan', 'return'), ('hasil', 'return'),
+
+    # Boolean and Logic
+    ('benar', 'True'), ('ya', 'True'), ('iya', 'True'),
+    ('salah', 'False'),
+    ('kosong', 'None'), ('tidak_ada', 'None'), ('null', 'None'),
+    ('dan', 'and'), ('serta', 'and'), ('juga', 'and'),
+    ('atau', 'or'), ('ataupun', 'or'),
+    ('bukan', 'not'), ('tidak', 'not'), ('negate', 'not'),
+
+    # Exception Handling
+    ('coba', 'try'), ('percobaan', 'try'),
+    ('kecuali', 'except'), ('tangkap', 'except'), ('error', 'except'),
+    ('akhirnya', 'finally'), ('terakhir', 'finally'),
+    ('lempar', 'raise'), ('angkat', 'raise'), ('throw', 'raise'),
+
+    # Class and Object
+    ('kelas', 'class'), ('class', 'class'), ('objek', 'object'),
+    ('diri', 'self'), ('ini', 'self'),
+    ('super_class', 'super'), ('induk', 'super'),
+
+    # Import and Module
+    ('impor', 'import'), ('muat', 'import'), ('gunakan', 'import'),
+    ('dari', 'from'), ('ambil_dari', 'from'),
+    ('sebagai', 'as'), ('alias', 'as'), ('dengan_nama', 'as'),
+
+    # Advanced
+    ('lambda_func', 'lambda'), ('fungsi_anonim', 'lambda'),
+    ('generator', 'yield'), ('hasilkan', 'yield'),
+    ('dengan', 'with'), ('gunakan_dengan', 'with'),
+    ('tegas', 'assert'), ('pastikan', 'assert'), ('validasi', 'assert'),
+
+    # Database (common patterns)
+    ('buka_database', 'sqlite3.connect'),
+    ('eksekusi_sql', 'execute'),
+    ('ambil_data', 'fetchall'),
+    ('ambil_satu', 'fetchone'),
+    ('commit_db', 'commit'),
+    ('tutup_db', 'close'),
+)
+
+class KeywordIndex(NamedTuple):
+    """Index kata immutable, dibangun sekali per proses dan dipakai semua translator"""
+    function_map: types.MappingProxyType
+    keyword_words: frozenset   # target keyword Python: jika -> if
+    method_words: frozenset    # hanya sebagai method call: .tambah( -> .append(
+    fallback_source: str       # regex gabungan semua kategori, untuk regex fallback
+    version: str
+    
+    @property
+    def fallback_pattern(self) -> re.Pattern:
+        """fallback_source ter-compile, baru saat pertama dibutuhkan (tokenize gagal)"""
+        return _compile_fallback(self.fallback_source)
+
+@functools.lru_cache(maxsize=None)
+def _compile_fallback(source: str) -> re.Pattern:
+    return re.compile(source)
+
+def _word_alternation(words) -> str:
+    # Urutan deterministik (panjang dulu, lalu alfabet), tidak tergantung urutan insert
+    return '|'.join(re.escape(word) for word in sorted(words, key=lambda word: (-len(word), word)))
+
+def build_keyword_index(entries) -> KeywordIndex:
+    """Validasi entries dan bangun KeywordIndex; ValueError jika ada kata dengan target berbeda"""
+    function_map = {}
+    conflicts = []
+    for indo_word, python_word in entries:
+        existing = function_map.setdefault(indo_word, python_word)
+        if existing != python_word:
+            conflicts.append(f"{indo_word!r}: {existing!r} vs {python_word!r}")
+    if conflicts:
+        raise ValueError("Konflik keyword map: " + ', '.join(conflicts))
+    
+    # Kelompokkan kata: keyword Python, nama bebas (builtin/dotted), method
+    keyword_words, name_words, method_words = set(), set(), set()
+    for indo_word, python_word in function_map.items():
+        if keyword.iskeyword(python_word):
+            keyword_words.add(indo_word)
+        elif '.' in python_word or python_word == 'self' or hasattr(builtins, python_word):
+            name_words.add(indo_word)
+        else:
+            method_words.add(indo_word)
+    
+    # Posisi mengikuti token pass: keyword/nama bukan sebagai attribute,
+    # method hanya dalam bentuk obj.kata(
+    fallback_source = '|'.join((
+        rf'(?<![.\w])(?:{_word_alternation(keyword_words)})\b',
+        rf'(?<![.\w])(?:{_word_alternation(name_words)})\b',
+        rf'(?<=\.)(?:{_word_alternation(method_words)})\b(?=\s*\()',
+    ))
+    
+    # Fingerprint map + translator version untuk cache key
+    items = repr(sorted(function_map.items()))
+    version = hashlib.sha256(f"{TRANSLATOR_VERSION}:{items}".encode('utf-8')).hexdigest()[:16]
+    
+    return KeywordIndex(
+        function_map=types.MappingProxyType(function_map),
+        keyword_words=frozenset(keyword_words),
+        method_words=frozenset(method_words),
+        fallback_source=fallback_source,
+        version=version,
+    )
+
+KEYWORD_INDEX = build_keyword_index(KEYWORD_ENTRIES)
+
+class PersistentTranslationCache:
+    """On-disk cache (mirip __pycache__) untuk translated source + bytecode"""
+    
+    def __init__(self, map_version: str, cache_dir: Optional[str] = None):
+        self.map_version = map_version
+        self.cache_dir = cache_dir
+        self.stats = {
+            'disk_hits': 0,
+            'disk_misses': 0,
+            'disk_writes': 0,
+            'disk_errors': 0
+        }
+    
+    def entry_path(self, source_path: str) -> str:
+        """Lokasi entry cache untuk sebuah source file"""
+        source_path = os.path.abspath(source_path)
+        base_name = os.path.basename(source_path)
+        tag = sys.implementation.cache_tag or 'python'
+        
+        if self.cache_dir is None:
+            directory = os.path.join(os.path.dirname(source_path), CACHE_DIR_NAME)
+            return os.path.join(directory, f"{base_name}.{tag}.pysc")
+        
+        # Shared cache dir: path hash agar nama file sama tidak bentrok
+        path_hash = hashlib.sha1(source_path.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{base_name}.{path_hash}.{tag}.pysc")
+    
+    def make_key(self, source: str) -> bytes:
+        """Key = content hash + function_map version + interpreter version"""
+        return self._finish_key(hashlib.sha256(source.encode('utf-8')))
+    
+    def make_file_key(self, source_path: str) -> bytes:
+        """make_key dari raw bytes file, di-hash per block (file tidak utuh di memori)
+        
+        Sama dengan make_key(source) untuk file UTF-8 dengan newline '\\n'.
+        """
+        return self._finish_key(_hash_file(source_path))
+    
+    def _finish_key(self, digest) -> bytes:
+        digest.update(self.map_version.encode('ascii'))
+        digest.update(importlib.util.MAGIC_NUMBER)
+        return digest.digest()
+    
+    def is_fresh(self, source_path: str, key: bytes) -> bool:
+        """Cek header entry saja (tanpa unmarshal) - untuk skip rebuild"""
+        try:
+            with open(self.entry_path(source_path), 'rb') as f:
+                header = f.read(len(CACHE_MAGIC) + len(key))
+        except OSError:
+            return False
+        return header == CACHE_MAGIC + key
+    
+    def load(self, source_path: str, key: bytes) -> Optional[tuple[str, set, types.CodeType]]:
+        """Ambil entry valid, None jika tidak ada, stale, atau corrupt"""
+        try:
+            with open(self.entry_path(source_path), 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.stats['disk_misses'] += 1
+            return None
+        
+        header_size = len(CACHE_MAGIC) + len(key)
+        if data[:header_size] != CACHE_MAGIC + key:
+            # Stale (source/map/interpreter berubah) atau bukan file cache
+            self.stats['disk_misses'] += 1
+            return None
+        
+        try:
+            python_code, imports, code = marshal.loads(data[header_size:])
+        except (EOFError, ValueError, TypeError):
+            self.stats['disk_errors'] += 1
+            return None
+        
+        self.stats['disk_hits'] += 1
+        return python_code, set(imports), code
+    
+    def store(self, source_path: str, key: bytes, python_code: str,
+              imports: set, code: types.CodeType):
+        """Tulis entry secara atomic (temp file + os.replace)"""
+        import tempfile
+        path = self.entry_path(source_path)
+        directory = os.path.dirname(path)
+        payload = CACHE_MAGIC + key + marshal.dumps((python_code, tuple(sorted(imports)), code))
+        
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self.stats['disk_writes'] += 1
+        except OSError:
+            # Read-only dir dsb - cache hanya optimasi, jangan gagalkan eksekusi
+            self.stats['disk_errors'] += 1
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+# Receiver yang aman tanpa kurung di depan '.method(...)'
+_ATOMIC_RECEIVERS = (ast.Name, ast.Attribute, ast.Call, ast.Subscript, ast.List, ast.Dict,
+                     ast.Set, ast.ListComp, ast.DictComp, ast.SetComp, ast.JoinedStr)
+
+def _splice_method_calls(text: str, calls: List[ast.Call]) -> str:
+    """Terapkan rewrite method call ke text (jumlah baris tetap)
+    
+    `calls` adalah node hasil IndonesianTransformer.transform: obj.tambah(v)
+    dengan attr yang sudah diganti, atau tambah(obj, v) yang func-nya sudah
+    jadi Attribute dan receiver dipindah; posisinya masih posisi di `text`.
+    """
+    if not calls:
+        return text
+    lines = _split_lines(text)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+    
+    def offset(lineno: int, col: int) -> int:
+        # col_offset AST dalam UTF-8 bytes
+        line = lines[lineno - 1]
+        return line_starts[lineno - 1] + len(line.encode('utf-8')[:col].decode('utf-8', 'ignore'))
+    
+    def span(node: ast.AST) -> tuple[int, int]:
+        return offset(node.lineno, node.col_offset), offset(node.end_lineno, node.end_col_offset)
+    
+    def render(start: int, end: int, nested: List[tuple[int, int, ast.Call]]) -> str:
+        pieces = []
+        cursor = start
+        index = 0
+        while index < len(nested):
+            call_start, call_end, call = nested[index]
+            inner = []
+            index += 1
+            while index < len(nested) and nested[index][1] <= call_end:
+                inner.append(nested[index])
+                index += 1
+            pieces.append(text[cursor:call_start])
+            pieces.append(render_call(call_start, call_end, call, inner))
+            cursor = call_end
+        pieces.append(text[cursor:end])
+        return ''.join(pieces)
+    
+    def render_call(call_start, call_end, call, inner) -> str:
+        receiver = call.func.value
+        receiver_start, receiver_end = span(receiver)
+        receiver_text = render(receiver_start, receiver_end,
+                               [item for item in inner if item[0] >= receiver_start and item[1] <= receiver_end])
+        if not (isinstance(receiver, _ATOMIC_RECEIVERS)
+                or (isinstance(receiver, ast.Constant) and isinstance(receiver.value, str))):
+            receiver_text = f"({receiver_text})"
+        
+        rest = call.args + call.keywords
+        close = call_end - 1  # posisi ')'
+        rest_start = min(span(node)[0] for node in rest) if rest else close
+        rest_text = render(rest_start, close,
+                           [item for item in inner if item[0] >= rest_start and item[1] <= close])
+        
+        # Newline di bagian yang dibuang ('tambah(' dan ', ') dipindah ke dalam kurung
+        dropped = text[call_start:receiver_start] + text[receiver_end:rest_start]
+        padding = ''
+        if '\n' in dropped:
+            tail = dropped[dropped.rfind('\n') + 1:]
+            padding = '\n' * dropped.count('\n') + tail[:len(tail) - len(tail.lstrip())]
+        return f"{receiver_text}.{call.func.attr}({padding}{rest_text})"
+    
+    nested = sorted((span(call) + (call,) for call in calls), key=lambda item: (item[0], -item[1]))
+    return render(0, len(text), nested)
+
+def _class_scope_names(statement: ast.stmt) -> Iterator[ast.Name]:
+    """Name di satu statement body class, tanpa statement nested (body def/blok)"""
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Name):
+            yield node
+        stack.extend(child for child in ast.iter_child_nodes(node) if not isinstance(child, ast.stmt))
 
 class IndonesianTransformer(ast.NodeTransformer):
-    """AST Transformer untuk handle complex expressions"""
+    """AST Transformer untuk handle complex expressions
     
-    def __init__(self, function_map: Dict[str, str]):
+    Method call diselesaikan dalam satu walk: obj.tambah(v) dan bentuk
+    fungsi bebas tambah(obj, v) dikumpulkan dulu, lalu di transform() jadi
+    obj.append(v). obj.tambah(v) dibiarkan jika source mendefinisikan
+    tambah sebagai member (def/atribut di body class, obj.tambah = ...);
+    tambah(obj, v) dibiarkan jika nama itu di-bind di module (def tambah /
+    tambah = ... / import ... as tambah).
+    """
+    
+    def __init__(self, function_map: Dict[str, str], method_words: frozenset = frozenset()):
         self.function_map = function_map
+        # Kata method (nilai -> values) bukan nama bebas, jangan rename variable
+        self.method_words = method_words
         self.required_imports = set()
+        self.bound_names = set()
+        # Nama yang didefinisikan source sebagai method/atribut (obj.nama)
+        self.member_names = set()
+        self._method_candidates = []
+        self._attribute_candidates = []
+        # Name member class di body class (id node): dipakai sebagai obj.nama, jangan rename
+        self._class_attributes = set()
+        # Call yang sudah jadi obj.method(...) - untuk splice text (AOT build)
+        self.method_rewrites = []
+    
+    def transform(self, tree: ast.AST) -> ast.AST:
+        """Visit tree lalu terapkan rewrite fungsi bebas -> method call"""
+        tree = self.visit(tree)
+        for call in self._attribute_candidates:
+            if call.func.attr in self.member_names:
+                # Method milik source sendiri (def tambah di class)
+                continue
+            call.func.attr = self.function_map[call.func.attr]
+            self.method_rewrites.append(call)
+        for call in self._method_candidates:
+            if call.func.id in self.bound_names:
+                continue
+            receiver, *arguments = call.args
+            method = ast.Attribute(value=receiver, attr=self.function_map[call.func.id], ctx=ast.Load())
+            call.func = ast.copy_location(method, call.func)
+            call.args = arguments
+            self.method_rewrites.append(call)
+        return tree
+    
+    def _resolve_name(self, node: ast.Name) -> ast.expr:
+        """Ganti Name Indonesia dengan Name/Attribute Python yang valid"""
+        new_name = self.function_map[node.id]
+        if '.' not in new_name:
+            node.id = new_name
+            return node
+        
+        # Handle imports yang dibutuhkan: 'statistics.mean' -> Attribute chain
+        module_name, *attributes = new_name.split('.')
+        self.required_imports.add(f"import {module_name}")
+        resolved = ast.Name(id=module_name, ctx=ast.Load())
+        for attribute in attributes:
+            resolved = ast.Attribute(value=resolved, attr=attribute, ctx=ast.Load())
+        return ast.copy_location(resolved, node)
+    
+    def _is_translatable(self, node: ast.AST) -> bool:
+        return (isinstance(node, ast.Name)
+                and node.id in self.function_map
+                and node.id not in self.method_words)
     
     def visit_Call(self, node):
         """Transform function calls"""
-        if isinstance(node.func, ast.Name):
-            original_name = node.func.id
-            if original_name in self.function_map:
-                new_name = self.function_map[original_name]
-                
-                # Handle imports yang dibutuhkan
-                if '.' in new_name:
-                    module_name = new_name.split('.')[0]
-                    self.required_imports.add(f"import {module_name}")
-                
-                node.func.id = new_name
+        func = node.func
+        if self._is_translatable(func):
+            node.func = self._resolve_name(func)
+        elif isinstance(func, ast.Attribute) and func.attr in self.method_words:
+            # obj.tambah(v) -> obj.append(v), setelah semua binding diketahui
+            self._attribute_candidates.append(node)
+        elif (isinstance(func, ast.Name) and func.id in self.method_words
+              and node.args and not isinstance(node.args[0], ast.Starred)):
+            # tambah(obj, v) -> obj.append(v), setelah semua binding diketahui
+            self._method_candidates.append(node)
         
         return self.generic_visit(node)
     
+    def _bind(self, node, name: Optional[str]):
+        if name:
+            self.bound_names.add(name)
+        return self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node):
+        return self._bind(node, node.name)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node):
+        # Sama dengan token pass: def dan target pertama assignment di body
+        # langsung, plus pemakaian nama itu di statement body class
+        members = set()
+        for statement in node.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                members.add(statement.name)
+                continue
+            if isinstance(statement, ast.Assign):
+                target = statement.targets[0]
+            elif isinstance(statement, ast.AnnAssign):
+                target = statement.target
+            else:
+                continue
+            if isinstance(target, ast.Name):
+                members.add(target.id)
+        self.member_names |= members
+        for statement in node.body:
+            for name in _class_scope_names(statement):
+                if name.id in members:
+                    self._class_attributes.add(id(name))
+        return self._bind(node, node.name)
+    
+    def visit_arg(self, node):
+        return self._bind(node, node.arg)
+    
+    def visit_alias(self, node):
+        return self._bind(node, node.asname or node.name.split('.')[0])
+    
+    def visit_ExceptHandler(self, node):
+        return self._bind(node, node.name)
+    
+    def visit_MatchAs(self, node):
+        return self._bind(node, node.name)
+    
+    def visit_MatchStar(self, node):
+        return self._bind(node, node.name)
+    
+    def visit_Attribute(self, node):
+        if not isinstance(node.ctx, ast.Load):
+            self.member_names.add(node.attr)
+        return self.generic_visit(node)
+    
     def visit_Name(self, node):
         """Transform variable names dan constants"""
-        if node.id in self.function_map:
-            node.id = self.function_map[node.id]
-        return node
+        if not isinstance(node.ctx, ast.Load):
+            self.bound_names.add(node.id)
+        if not self._is_translatable(node) or id(node) in self._class_attributes:
+            return node
+        # Target dotted (statistics.mean) tidak bisa jadi assignment target
+        if '.' in self.function_map[node.id] and not isinstance(node.ctx, ast.Load):
+            return node
+        return self._resolve_name(node)
+
+# Context manager kosong bersama: overhead stage timing saat instrumentation off
+_NULL_STAGE = contextlib.nullcontext()
+
+class PipelineInstrumentation:
+    """Wall-time histogram per pipeline stage dan per file, plus hook callbacks
+    
+    Stage: read, translate, ast-transform, compile, exec. 'read' hanya ada
+    untuk file (disk cache key atau source); snippet execute_code sudah di
+    memori sehingga mulai dari translate. Hook dipanggil
+    sebagai hook(stage, filename, seconds) untuk diteruskan ke sistem
+    metrics. Dengan profile=True, eksekusi user code dijalankan di bawah
+    cProfile dan report menunjuk ke baris source Indonesia aslinya.
+    """
+    
+    STAGES = ('read', 'translate', 'ast-transform', 'compile', 'exec')
+    # Upper bound bucket dalam detik; bucket terakhir = overflow
+    BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+    
+    def __init__(self, profile: bool = False):
+        self.histograms = {stage: [0] * (len(self.BUCKETS) + 1) for stage in self.STAGES}
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.per_file = defaultdict(lambda: defaultdict(float))
+        self.hooks = []
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+        self.sources = {}
+        self.executed_files = set()
+    
+    def add_hook(self, hook: Callable[[str, str, float], None]):
+        self.hooks.append(hook)
+    
+    def record(self, stage: str, filename: str, seconds: float):
+        histogram = self.histograms.setdefault(stage, [0] * (len(self.BUCKETS) + 1))
+        for index, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                histogram[index] += 1
+                break
+        else:
+            histogram[-1] += 1
+        self.totals[stage] += seconds
+        self.counts[stage] += 1
+        self.per_file[filename][stage] += seconds
+        for hook in self.hooks:
+            hook(stage, filename, seconds)
+    
+    @contextlib.contextmanager
+    def stage(self, stage: str, filename: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, filename, time.perf_counter() - start)
+    
+    def execute(self, code: types.CodeType, globals_: dict, locals_: Optional[dict] = None,
+                filename: str = '<pys>', source: Optional[str] = None):
+        """exec user code dengan timing stage 'exec' (dan cProfile jika aktif)"""
+        if source is not None and self.profiler is not None:
+            # Snippet tanpa file: simpan source untuk report profile
+            self.sources[filename] = source.splitlines()
+        self.executed_files.add(filename)
+        with self.stage('exec', filename):
+            if self.profiler is None:
+                exec(code, globals_, locals_)
+                return
+            self.profiler.enable()
+            try:
+                exec(code, globals_, locals_)
+            finally:
+                self.profiler.disable()
+    
+    def summary(self) -> dict:
+        """Ringkasan JSON-serializable per stage dan per file"""
+        return {
+            'stages': {
+                stage: {
+                    'count': self.counts[stage],
+                    'total_ms': round(self.totals[stage] * 1000, 3),
+                    'histogram': dict(zip([f"<={bound}s" for bound in self.BUCKETS] + ['overflow'],
+                                          self.histograms[stage])),
+                }
+                for stage in self.histograms if self.counts[stage]
+            },
+            'files': {
+                filename: {stage: round(seconds * 1000, 3) for stage, seconds in stages.items()}
+                for filename, stages in self.per_file.items()
+            },
+        }
+    
+    def _source_line(self, filename: str, lineno: int) -> str:
+        if filename in self.sources:
+            lines = self.sources[filename]
+            return lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ''
+        return linecache.getline(filename, lineno).strip()
+    
+    def profile_report(self, limit: int = 15) -> List[tuple[str, int, str, str, float, float]]:
+        """User-code functions (filename, line, function, source Indonesia, tottime, cumtime)"""
+        if self.profiler is None:
+            return []
+        import pstats
+        stats = pstats.Stats(self.profiler)
+        rows = []
+        for (filename, lineno, function), entry in stats.stats.items():
+            # Hanya code hasil translation (.pys / snippet), bukan runtime/stdlib
+            if filename not in self.executed_files:
+                continue
+            tottime, cumtime = entry[2], entry[3]
+            rows.append((filename, lineno, function, self._source_line(filename, lineno), tottime, cumtime))
+        rows.sort(key=lambda row: row[5], reverse=True)
+        return rows[:limit]
+    
+    def print_report(self):
+        print("=" * 50)
+        print("PIPELINE TIMINGS:")
+        for stage, data in self.summary()['stages'].items():
+            print(f"{stage:>14}: {data['count']:5d}x  {data['total_ms']:10.3f} ms")
+        for filename, stages in self.summary()['files'].items():
+            parts = ', '.join(f"{stage} {ms:.2f}ms" for stage, ms in stages.items())
+            print(f"  {filename}: {parts}")
+        
+        rows = self.profile_report()
+        if rows:
+            print("\nPROFILE (cumulative, baris source asli):")
+            for filename, lineno, function, source_line, tottime, cumtime in rows:
+                print(f"{cumtime * 1000:10.3f} ms  {os.path.basename(filename)}:{lineno} "
+                      f"{function}  | {source_line}")
+
+class IncrementalTranslation:
+    """Artifact translate_incremental: translation per logical line (chunk)
+    
+    Simpan object ini lalu berikan kembali ke translate_incremental
+    bersama source baru (mis. dari file watcher).
+    """
+    
+    def __init__(self, chunks: List[tuple[str, str, frozenset]], retranslated: int = 0,
+                 states: Optional[List[tuple]] = None):
+        # (source, translated, imports) per logical line / baris kosong
+        self.chunks = chunks
+        self.retranslated = retranslated
+        # Snapshot _ClassScope sebelum setiap chunk (dan setelah yang terakhir)
+        self.states = states
+    
+    @property
+    def source(self) -> str:
+        return ''.join(chunk[0] for chunk in self.chunks)
+    
+    @property
+    def code(self) -> str:
+        return ''.join(chunk[1] for chunk in self.chunks)
+    
+    @property
+    def imports(self) -> set:
+        imports = set()
+        for _, _, chunk_imports in self.chunks:
+            imports.update(chunk_imports)
+        return imports
 
 class SmartTranslator:
     """Core translation engine dengan multiple strategies"""
     
-    def __init__(self):
-        self.function_map = self._build_function_map()
+    def __init__(self, max_cache_bytes: Optional[int] = None, thread_safe: bool = False):
+        # Index kata dibagi semua translator (immutable, dibangun saat import)
+        self.keywords = KEYWORD_INDEX
+        self.function_map = self.keywords.function_map
+        self.keyword_words = self.keywords.keyword_words
+        self.method_words = self.keywords.method_words
         self.cache = MemoryAwareCache(max_size=5000)
-        self.ast_cache = MemoryAwareCache(max_size=1000)
-        self.line_cache = MemoryAwareCache(max_size=10000)
+        # thread_safe: line cache sharded + single-flight, stats per thread
+        self.thread_safe = thread_safe
+        cache_class = ShardedMemoryCache if thread_safe else MemoryAwareCache
+        # translated text -> compiled line (lihat compile_line)
+        self.ast_cache = cache_class(max_size=1000)
+        self.line_cache = cache_class(max_size=10000, max_bytes=max_cache_bytes)
+        # source snippet -> (translated, imports, marshal code), lihat compile_code
+        self.snippet_cache = cache_class(max_size=1000, max_bytes=SNIPPET_CACHE_MAX_BYTES)
+        self.map_version = self.keywords.version
+        
+        # Optional PipelineInstrumentation (None = nonaktif, overhead ~nol)
+        self.instrumentation = None
         
         # Performance tracking
-        self.stats = {
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'translations': 0,
-            'ast_transformations': 0
-        }
+        stat_keys = ('cache_hits', 'cache_misses', 'translations', 'ast_transformations', 'code_cache_hits',
+                     'snippet_cache_hits')
+        self.stats = ThreadLocalCounters(stat_keys) if thread_safe else dict.fromkeys(stat_keys, 0)
     
-    def _build_function_map(self) -> Dict[str, str]:
-        """Build comprehensive function mapping"""
-        return {
-            # Basic I/O - Multiple aliases dengan prioritas
-            'cetak': 'print', 'tampilkan': 'print', 'tulis': 'print', 'keluarkan': 'print',
-            'masukan': 'input', 'input_pengguna': 'input', 'ambil_input': 'input', 'tanya': 'input',
-            
-            # Data Type Conversion
-            'ke_angka': 'int', 'ke_integer': 'int', 'ke_bilangan': 'int',
-            'ke_desimal': 'float', 'ke_float': 'float', 'ke_pecahan': 'float',
-            'ke_teks': 'str', 'ke_string': 'str', 'ke_kata': 'str',
-            'ke_boolean': 'bool', 'ke_bool': 'bool',
-            
-            # String Operations
-            'panjang': 'len', 'ukuran': 'len', 'hitung': 'len', 'banyak': 'len',
-            'gabung': 'join', 'sambung': 'join', 'satukan': 'join',
-            'pisah': 'split', 'bagi': 'split', 'potong': 'split', 'pecah': 'split',
-            'ganti': 'replace', 'ubah': 'replace', 'tukar': 'replace', 'substitusi': 'replace',
-            'cari': 'find', 'temukan': 'find', 'lokasi': 'find', 'posisi': 'find',
-            'huruf_besar': 'upper', 'kapital': 'upper', 'besar_semua': 'upper',
-            'huruf_kecil': 'lower', 'kecil_semua': 'lower', 'lowercase': 'lower',
-            'awalan': 'startswith', 'dimulai_dengan': 'startswith',
-            'akhiran': 'endswith', 'diakhiri_dengan': 'endswith',
-            'hapus_spasi': 'strip', 'trim': 'strip', 'bersihkan': 'strip',
-            
-            # List Operations
-            'daftar': 'list', 'buat_daftar': 'list', 'array': 'list', 'senarai': 'list',
-            'tambah': 'append', 'masukkan': 'append', 'sisipkan': 'insert',
-            'hapus': 'remove', 'buang': 'remove', 'hilangkan': 'pop', 'keluarkan': 'pop',
-            'urutkan': 'sort', 'sortir': 'sort', 'susun': 'sort', 'atur': 'sorted',
-            'balik': 'reverse', 'kebalikan': 'reverse', 'terbalik': 'reversed',
-            'salin': 'copy', 'duplikat': 'copy', 'kopi': 'copy',
-            'kosongkan': 'clear', 'bersihkan_daftar': 'clear',
-            'hitung_item': 'count', 'jumlah_item': 'count',
-            
-            # Dictionary Operations
-            'kamus': 'dict', 'dictionary': 'dict', 'buat_kamus': 'dict', 'peta': 'dict',
-            'kunci': 'keys', 'semua_kunci': 'keys', 'daftar_kunci': 'keys',
-            'nilai': 'values', 'semua_nilai': 'values', 'daftar_nilai': 'values',
-            'item': 'items', 'semua_item': 'items', 'pasangan': 'items',
-            'ambil': 'get', 'dapatkan': 'get', 'cari_nilai': 'get',
-            'perbarui': 'update', 'gabung_kamus': 'update',
-            
-            # File Operations
-            'buka_file': 'open', 'baca_file': 'open', 'akses_file': 'open',
-            'tutup_file': 'close', 'simpan_file': 'write',
-            
-            # Math Operations
-            'maksimum': 'max', 'terbesar': 'max', 'paling_besar': 'max',
-            'minimum': 'min', 'terkecil': 'min', 'paling_kecil': 'min',
-            'jumlah': 'sum', 'total': 'sum', 'tambah_semua': 'sum', 'sigma': 'sum',
-            'rata_rata': 'statistics.mean', 'mean': 'statistics.mean', 'rerata': 'statistics.mean',
-            'median': 'statistics.median', 'nilai_tengah': 'statistics.median',
-            'bulat': 'round', 'pembulatan': 'round', 'bulatkan': 'round',
-            'absolut': 'abs', 'mutlak': 'abs', 'nilai_absolut': 'abs',
-            'pangkat': 'pow', 'eksponen': 'pow', 'kuadrat': 'pow',
-            
-            # Range and Iteration
-            'rentang': 'range', 'jangkauan': 'range', 'dari_sampai': 'range',
-            'enumerasi': 'enumerate', 'enum': 'enumerate', 'nomori': 'enumerate',
-            'zip_data': 'zip', 'gabung_data': 'zip', 'pasangkan': 'zip',
-            
-            # Type Checking
-            'tipe': 'type', 'jenis': 'type', 'type_data': 'type',
-            'adalah_angka': 'isinstance', 'adalah_teks': 'isinstance',
-            
-            # Control Flow Keywords
-            'jika': 'if', 'kalau': 'if', 'bila': 'if', 'andai': 'if',
-            'atau_jika': 'elif', 'atau_kalau': 'elif', 'else_if': 'elif',
-            'selain_itu': 'else', 'lainnya': 'else', 'jika_tidak': 'else',
-            'untuk': 'for', 'setiap': 'for', 'tiap': 'for',
-            'selama': 'while', 'ketika': 'while', 'saat': 'while',
-            'dalam': 'in', 'di': 'in', 'pada': 'in', 'ada_dalam': 'in',
-            'keluar': 'break', 'berhenti': 'break', 'stop': 'break',
-            'lanjut': 'continue', 'skip': 'continue', 'lewati': 'continue',
-            'kembali': 'return', 'kembalikan': 'return', 'hasil': 'return',
-            
-            # Boolean and Logic
-            'benar': 'True', 'ya': 'True', 'iya': 'True',
-            'salah': 'False', 'tidak': 'False', 'bukan': 'False',
-            'kosong': 'None', 'tidak_ada': 'None', 'null': 'None',
-            'dan': 'and', 'serta': 'and', 'juga': 'and',
-            'atau': 'or', 'ataupun': 'or',
-            'bukan': 'not', 'tidak': 'not', 'negate': 'not',
-            
-            # Exception Handling
-            'coba': 'try', 'percobaan': 'try',
-            'kecuali': 'except', 'tangkap': 'except', 'error': 'except',
-            'akhirnya': 'finally', 'terakhir': 'finally',
-            'lempar': 'raise', 'angkat': 'raise', 'throw': 'raise',
-            
-            # Class and Object
-            'kelas': 'class', 'class': 'class', 'objek': 'object',
-            'diri': 'self', 'ini': 'self',
-            'super_class': 'super', 'induk': 'super',
-            
-            # Import and Module
-            'impor': 'import', 'muat': 'import', 'gunakan': 'import',
-            'dari': 'from', 'ambil_dari': 'from',
-            'sebagai': 'as', 'alias': 'as', 'dengan_nama': 'as',
-            
-            # Advanced
-            'lambda_func': 'lambda', 'fungsi_anonim': 'lambda',
-            'generator': 'yield', 'hasilkan': 'yield',
-            'dengan': 'with', 'gunakan_dengan': 'with',
-            'tegas': 'assert', 'pastikan': 'assert', 'validasi': 'assert',
-            
-            # Database (common patterns)
-            'buka_database': 'sqlite3.connect',
-            'eksekusi_sql': 'execute',
-            'ambil_data': 'fetchall',
-            'ambil_satu': 'fetchone',
-            'commit_db': 'commit',
-            'tutup_db': 'close',
-        }
-    
-    def _create_line_hash(self, line: str) -> str:
-        """Create hash for caching"""
-        return hashlib.md5(line.encode()).hexdigest()
+    def _replace_keyword(self, match: re.Match) -> str:
+        return self.function_map[match.group()]
     
     def _simple_translation(self, line: str) -> str:
-        """Fast string-based translation for simple cases"""
-        translated = line
+        """Fast string-based translation for simple cases (single scan)"""
+        return self.keywords.fallback_pattern.sub(self._replace_keyword, line)
+    
+    def _ast_translation(self, code: str, filename: str = '<pys>') -> tuple[ast.Module, set]:
+        """AST stage: parse sekali, transform in place, tanpa ast.unparse
+        
+        Location info tetap dari source asli sehingga code object hasil
+        compile(tree, filename, 'exec') menunjuk ke baris file .pys.
+        """
+        tree, transformer = self._transform(code, filename)
+        return tree, transformer.required_imports
+    
+    def _transform(self, code: str, filename: str) -> tuple[ast.Module, IndonesianTransformer]:
+        tree = ast.parse(code, filename)
+        transformer = IndonesianTransformer(self.function_map, self.method_words)
+        tree = transformer.transform(tree)
+        ast.fix_missing_locations(tree)
+        self.stats['ast_transformations'] += 1
+        return tree, transformer
+    
+    def transpile(self, code: str, filename: str = '<pys>') -> tuple[str, List[tuple[int, int, int]]]:
+        """Source Pys -> source Python mandiri (tanpa runtime), untuk AOT build
+        
+        Token pass + rewrite AST (tambah(obj, v) -> obj.append(v)) di-splice
+        ke text, lalu import yang dibutuhkan (termasuk alias runtime seperti
+        statistik/json) disisipkan setelah docstring dan from __future__.
+        Return (python_source, segments); segments = [(output_line,
+        source_line, count)] sebagai source map.
+        """
+        translated, imports = self.translate_code(code)
+        tree, transformer = self._transform(translated, filename)
+        imports |= transformer.required_imports
+        python_code = _splice_method_calls(translated, transformer.method_rewrites)
+        
+        # Alias module yang di runtime tersedia sebagai global
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+                    and node.id in MODULE_ALIASES and node.id not in transformer.bound_names):
+                module_name = MODULE_ALIASES[node.id]
+                imports.add(f"import {module_name}" if module_name == node.id
+                            else f"import {module_name} as {node.id}")
         
-        # Sort by length descending untuk avoid partial replacement
-        sorted_functions = sorted(self.function_map.items(), key=lambda x: len(x[0]), reverse=True)
+        lines = _split_lines(python_code)
+        if not imports:
+            return python_code, [(1, 1, len(lines))] if lines else []
         
-        for indo_word, python_word in sorted_functions:
-            # Word boundary pattern untuk precision
-            pattern = r'\b' + re.escape(indo_word) + r'\b'
-            translated = re.sub(pattern, python_word, translated)
+        # Sisipkan setelah docstring / from __future__ (harus tetap paling atas)
+        insert_at = 0
+        for index, statement in enumerate(tree.body):
+            is_docstring = (index == 0 and isinstance(statement, ast.Expr)
+                            and isinstance(statement.value, ast.Constant)
+                            and isinstance(statement.value.value, str))
+            is_future = isinstance(statement, ast.ImportFrom) and statement.module == '__future__'
+            if not (is_docstring or is_future):
+                break
+            insert_at = statement.end_lineno
         
-        return translated
+        if insert_at and not lines[insert_at - 1].endswith('\n'):
+            lines[insert_at - 1] += '\n'
+        import_lines = [f"{statement}\n" for statement in sorted(imports)]
+        python_code = ''.join(lines[:insert_at] + import_lines + lines[insert_at:])
+        
+        segments = []
+        if insert_at:
+            segments.append((1, 1, insert_at))
+        if len(lines) > insert_at:
+            segments.append((insert_at + len(import_lines) + 1, insert_at + 1, len(lines) - insert_at))
+        return python_code, segments
     
-    def _ast_translation(self, code: str) -> tuple[str, set]:
-        """AST-based translation for complex expressions"""
-        try:
-            tree = ast.parse(code)
-            transformer = IndonesianTransformer(self.function_map)
-            new_tree = transformer.visit(tree)
-            
-            # Fix missing locations
-            ast.fix_missing_locations(new_tree)
-            
-            translated_code = ast.unparse(new_tree)
-            return translated_code, transformer.required_imports
+    def _ends_expression(self, token: Optional[tokenize.TokenInfo]) -> bool:
+        """Apakah token bisa diikuti '.' sebagai attribute access"""
+        if token is None:
+            return False
+        if token.type == tokenize.NAME:
+            # 'dari . impor x' / 'from . import x' adalah relative import
+            return not keyword.iskeyword(token.string) and token.string not in self.keyword_words
+        return token.type in (tokenize.NUMBER, tokenize.STRING) or token.string in (')', ']', '}')
+    
+    def _translate_name(self, token: tokenize.TokenInfo, is_attribute: bool,
+                        following: tokenize.TokenInfo, imports: set) -> Optional[str]:
+        """Tentukan pengganti NAME token berdasarkan posisinya, None = biarkan"""
+        python_word = self.function_map.get(token.string)
+        if python_word is None:
+            return None
+        
+        if is_attribute:
+            # Attribute name hanya di-rewrite sebagai method call: obj.tambah(...)
+            is_call = following.type == tokenize.OP and following.string == '('
+            if is_call and token.string in self.method_words:
+                return python_word
+            return None
+        
+        if token.string in self.method_words:
+            # Variable bernama nilai/item/kunci tetap apa adanya
+            return None
+        
+        if '.' in python_word:
+            imports.add(f"import {python_word.split('.')[0]}")
+        return python_word
+    
+    def _translate_member(self, token: tokenize.TokenInfo, index: int, previous: Optional[tokenize.TokenInfo],
+                          following: tokenize.TokenInfo, scope: _ClassScope, imports: set) -> Optional[str]:
+        """_translate_name untuk NAME di statement yang langsung di body class
+        
+        `index` = posisi token dalam statement. Nama yang didefinisikan di
+        body class (def nama / nama = ...) tetap seperti ditulis, begitu juga
+        pemakaiannya di statement body berikutnya. Kecuali method dengan kata
+        method: def tambah -> def append, sama dengan obj.tambah(...).
+        """
+        is_def = index <= 2 and previous is not None and previous.string == 'def'
+        if token.string in self.method_words:
+            return self.function_map[token.string] if is_def else None
+        if is_def or (index == 0 and following.string in ('=', ':')):
+            scope.bind(token.string)
+            return None
+        if scope.is_member(token.string):
+            return None
+        return self._translate_name(token, False, following, imports)
+    
+    def _translate_fstring(self, text: str, imports: set) -> str:
+        """Translate expression di replacement field f-string (Python < 3.12)"""
+        pieces = []
+        index = 0
+        while index < len(text):
+            char = text[index]
+            if char == '{' and text.startswith('{{', index):
+                pieces.append('{{')
+                index += 2
+                continue
+            if char == '{':
+                end = self._fstring_field_end(text, index + 1)
+                if end is None:
+                    return text
+                expression = text[index + 1:end]
+                pieces.append('{')
+                for _, translated, chunk_imports in self._iter_logical_lines(io.StringIO(expression).readline):
+                    pieces.append(translated)
+                    imports.update(chunk_imports)
+                index = end
+                continue
+            pieces.append(char)
+            index += 1
+        return ''.join(pieces)
+    
+    @staticmethod
+    def _fstring_field_end(text: str, start: int) -> Optional[int]:
+        """Index akhir expression sebuah replacement field (':', '!' atau '}')"""
+        depth = 0
+        quote = None
+        index = start
+        while index < len(text):
+            if quote is not None:
+                if text.startswith(quote, index):
+                    index += len(quote)
+                    quote = None
+                else:
+                    index += 1
+                continue
             
-        except SyntaxError:
-            # Fallback to simple translation
-            return self._simple_translation(code), set()
+            char = text[index]
+            if char in '\'"':
+                quote = text[index:index + 3] if text[index:index + 3] in ('"""', "'''") else char
+                index += len(quote)
+                continue
+            if char in '([{':
+                depth += 1
+            elif char in ')]':
+                depth -= 1
+            elif char == '}':
+                if depth == 0:
+                    return index
+                depth -= 1
+            elif depth == 0 and (char == ':' or (char == '!' and text[index + 1:index + 2] != '=')):
+                return index
+            index += 1
+        return None
     
-    def translate_line(self, line: str) -> str:
-        """Translate single line dengan caching"""
-        if not line.strip() or line.strip().startswith('#'):
-            return line
+    def _iter_logical_lines(self, readline: Callable[[], str], stream_fallback: bool = False,
+                            fallback_rows: Optional[list] = None, scope: Optional[_ClassScope] = None,
+                            class_rows: Optional[list] = None) -> Iterator[tuple[str, str, frozenset]]:
+        """Streaming translation lewat tokenize, yield per logical line
+        
+        Yield (source, translated, imports) untuk setiap logical line atau
+        baris kosong/comment. Hanya NAME token di posisi keyword/builtin (dan
+        method call) yang di-rewrite; string, comment dan attribute name
+        tidak disentuh. Jumlah dan urutan baris output selalu sama dengan input.
+        Nama method (def) dan atribut yang di-assign langsung di body class
+        juga dibiarkan, karena dipakai sebagai obj.nama (lihat _translate_member).
+        
+        Jika tokenize gagal, sisa source jadi satu chunk regex fallback
+        (dibutuhkan translate_incremental); stream_fallback=True membuatnya
+        satu chunk per baris agar memori tetap terbatas. Baris tempat
+        fallback dimulai ditambahkan ke `fallback_rows` jika diberikan.
+        `scope` melanjutkan body class yang terbuka (translate_incremental);
+        baris yang translasinya bergantung pada body class masuk `class_rows`.
+        """
+        source_lines = {}
+        indents = {}
+        replacements = defaultdict(list)
+        imports = set()
+        next_row = 1
+        rows_read = 0
+        
+        def stripped_readline():
+            # Indentasi di-strip sebelum tokenize: tidak ada IndentationError dan
+            # setiap logical line hasilnya sama meski di-tokenize terpisah
+            nonlocal rows_read
+            line = readline()
+            if not line:
+                return line
+            rows_read += 1
+            stripped = line.lstrip(' \t\f')
+            source_lines[rows_read] = line
+            indents[rows_read] = len(line) - len(stripped)
+            return stripped
+        
+        def flush(last_row):
+            # Gabungkan baris next_row..last_row jadi satu chunk
+            nonlocal next_row, imports
+            source, translated = [], []
+            while next_row <= last_row and next_row in source_lines:
+                line = source_lines.pop(next_row)
+                indent = indents.pop(next_row)
+                source.append(line)
+                for start, end, text in reversed(replacements.pop(next_row, ())):
+                    line = line[:indent + start] + text + line[indent + end:]
+                translated.append(line)
+                next_row += 1
+            if not source:
+                return None
+            chunk_imports = frozenset(imports) if imports else _NO_IMPORTS
+            imports = set()
+            return ''.join(source), ''.join(translated), chunk_imports
         
-        line_hash = self._create_line_hash(line)
-        cached = self.line_cache.get(line_hash)
+        previous = None
+        pending = None
+        pending_is_attribute = False
+        pending_index = 0
+        attribute_dot = False
+        depth = 0
+        scope = scope or _ClassScope()
+        statement_index = 0
+        in_class_body = False
+        try:
+            for token in tokenize.generate_tokens(stripped_readline):
+                token_type = token.type
+                if token_type == tokenize.OP:
+                    if token.string in _OPENING_BRACKETS:
+                        depth += 1
+                    elif token.string in _CLOSING_BRACKETS:
+                        depth -= 1
+                        if depth < 0:
+                            raise tokenize.TokenError('unmatched closing bracket', token.start)
+                
+                is_boundary = token_type == tokenize.NEWLINE or (token_type == tokenize.NL and depth == 0)
+                if token_type in _LAYOUT_TOKENS and not is_boundary:
+                    continue
+                
+                if statement_index == 0 and not is_boundary and token_type != tokenize.ENDMARKER:
+                    word = token.string if token_type == tokenize.NAME else None
+                    in_class_body = scope.enter(indents[token.start[0]], self.function_map.get(word, word))
+                
+                if pending is not None:
+                    if (in_class_body and not pending_is_attribute and pending.string in self.function_map
+                            and pending.string not in self.keyword_words):
+                        replacement = self._translate_member(pending, pending_index, previous, token,
+                                                             scope, imports)
+                        if class_rows is not None:
+                            class_rows.append(pending.start[0])
+                    else:
+                        replacement = self._translate_name(pending, pending_is_attribute, token, imports)
+                    if replacement is not None:
+                        row, column = pending.start
+                        replacements[row].append((column, pending.end[1], replacement))
+                    previous = pending
+                    pending = None
+                
+                if token_type == tokenize.NAME:
+                    pending = token
+                    pending_index = statement_index
+                    pending_is_attribute = (
+                        previous is not None and previous.string == '.'
+                        and previous.type == tokenize.OP and attribute_dot
+                    )
+                else:
+                    if token_type == tokenize.OP and token.string == '.':
+                        attribute_dot = self._ends_expression(previous)
+                    if (token_type == tokenize.STRING and not _FSTRING_TOKENIZED
+                            and 'f' in _STRING_PREFIX.match(token.string).group().lower()):
+                        translated = self._translate_fstring(token.string, imports)
+                        if translated != token.string and token.start[0] == token.end[0]:
+                            row, column = token.start
+                            replacements[row].append((column, token.end[1], translated))
+                    previous = token
+                
+                statement_index = 0 if is_boundary else statement_index + 1
+                if is_boundary:
+                    chunk = flush(token.start[0])
+                    if chunk is not None:
+                        yield chunk
+        except (tokenize.TokenError, SyntaxError):
+            # Source tidak lengkap/invalid: fallback ke regex untuk sisa baris,
+            # sebagai satu chunk sampai akhir file
+            if fallback_rows is not None:
+                fallback_rows.append(next_row)
+            rest = [source_lines.pop(row) for row in sorted(source_lines)]
+            if stream_fallback:
+                for line in rest:
+                    yield line, self._simple_translation(line), _NO_IMPORTS
+                for line in iter(readline, ''):
+                    yield line, self._simple_translation(line), _NO_IMPORTS
+                return
+            rest.extend(iter(readline, ''))
+            if rest:
+                translated = ''.join(self._simple_translation(line) for line in rest)
+                yield ''.join(rest), translated, _NO_IMPORTS
+            return
         
-        if cached:
+        chunk = flush(float('inf'))
+        if chunk is not None:
+            yield chunk
+    
+    def translate_line(self, line: str) -> str:
+        """Translate single line dengan caching (key = teks baris itu sendiri)"""
+        return self.translate_line_entry(line)[0]
+    
+    def translate_line_entry(self, line: str) -> tuple[str, frozenset]:
+        """translate_line plus required imports: (translated, imports)"""
+        cached = self.line_cache.get(line, _MISSING)
+        if cached is not _MISSING:
             self.stats['cache_hits'] += 1
             return cached
         
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            return line, _NO_IMPORTS
+        
+        # Baris sangat panjang (data embedding) tidak layak jadi cache key
+        cacheable = len(line) <= MAX_CACHED_LINE_LENGTH
+        if self.thread_safe and cacheable:
+            # Single-flight: N thread dengan baris yang sama -> satu translasi
+            entry, computed = self.line_cache.get_or_compute(
+                sys.intern(line), lambda: self._translate_line_uncached(line))
+            if computed:
+                self.stats['cache_misses'] += 1
+                self.stats['translations'] += 1
+            else:
+                self.stats['cache_hits'] += 1
+            return entry
+        
         self.stats['cache_misses'] += 1
         self.stats['translations'] += 1
+        entry = self._translate_line_uncached(line)
+        if cacheable:
+            self.line_cache.set(sys.intern(line), entry)
+        return entry
+    
+    def _translate_line_uncached(self, line: str) -> tuple[str, frozenset]:
+        """Token pass untuk satu baris -> (translated, imports) siap di-cache"""
+        translated = []
+        imports = set()
+        for _, translated_chunk, chunk_imports in self._iter_logical_lines(io.StringIO(line).readline):
+            translated.append(translated_chunk)
+            imports.update(chunk_imports)
+        return ''.join(translated), frozenset(imports)
+    
+    def translate_code(self, code: str) -> tuple[str, set]:
+        """Translate entire code block dalam satu streaming token pass"""
+        translated = []
+        imports = set()
+        for _, translated_chunk, chunk_imports in self._iter_logical_lines(io.StringIO(code).readline):
+            translated.append(translated_chunk)
+            imports.update(chunk_imports)
+        self.stats['translations'] += 1
+        return ''.join(translated), imports
+    
+    def translate_many(self, snippets: List[str], workers: Optional[int] = None) -> List[tuple[str, set]]:
+        """Batch translate_code: hasil sama, biaya sebanding jumlah baris unik
         
-        # Detect complexity untuk pilih strategy
-        is_complex = any(char in line for char in ['(', ')', '[', ']', '.'])
+        Snippet dan baris identik di seluruh batch di-translate sekali. Snippet
+        yang setiap barisnya adalah logical line lengkap disusun ulang dari
+        hasil per baris; sisanya (multi-line string, kurung lintas baris)
+        di-translate utuh. Dengan `workers`, batch besar dibagi ke process pool.
+        """
+        snippet_lines = {snippet: _split_lines(snippet) for snippet in dict.fromkeys(snippets)}
+        unique_lines = list(dict.fromkeys(line for lines in snippet_lines.values() for line in lines))
+        line_entries = dict(zip(unique_lines, _map_batch(
+            _batch_translate_lines, unique_lines, workers, self._translate_batch_lines)))
         
-        if is_complex and len(line.strip()) > 20:
-            # Use AST for complex expressions
-            try:
-                translated, imports = self._ast_translation(line)
-                self.stats['ast_transformations'] += 1
-            except:
-                translated = self._simple_translation(line)
+        results = {}
+        whole = []
+        for snippet, lines in snippet_lines.items():
+            entries = [line_entries[line] for line in lines]
+            if all(entry[2] for entry in entries):
+                imports = set()
+                for entry in entries:
+                    imports.update(entry[1])
+                results[snippet] = (''.join(entry[0] for entry in entries), imports)
+            else:
+                whole.append(snippet)
+        
+        for snippet, result in zip(whole, _map_batch(_batch_translate_snippets, whole, workers,
+                                                     self._translate_batch_snippets)):
+            results[snippet] = result
+        
+        self.stats['translations'] += len(snippet_lines)
+        return [(results[snippet][0], set(results[snippet][1])) for snippet in snippets]
+    
+    def _translate_batch_lines(self, lines: List[str]) -> List[tuple[str, frozenset, bool]]:
+        """(translated, imports, complete) per baris; complete = logical line utuh
+        
+        Header class tidak dihitung complete: translasi body-nya bergantung
+        pada class tersebut, jadi snippet-nya di-translate utuh.
+        """
+        entries = []
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                entries.append((line, _NO_IMPORTS, True))
+                continue
+            fallback_rows = []
+            translated = []
+            imports = set()
+            for _, chunk, chunk_imports in self._iter_logical_lines(io.StringIO(line).readline,
+                                                                    fallback_rows=fallback_rows):
+                translated.append(chunk)
+                imports.update(chunk_imports)
+            word = _LEADING_WORD.match(stripped)
+            is_class = word is not None and self.function_map.get(word.group(), word.group()) == 'class'
+            entries.append((''.join(translated), frozenset(imports), not fallback_rows and not is_class))
+        return entries
+    
+    def _translate_batch_snippets(self, snippets: List[str]) -> List[tuple[str, set]]:
+        return [self.translate_code(snippet) for snippet in snippets]
+    
+    def translate_stream(self, readline: Callable[[], str]) -> Iterator[tuple[str, frozenset]]:
+        """Generator (translated_chunk, imports) per logical line dengan memori terbatas
+        
+        Source dibaca lewat `readline` sedikit demi sedikit; hanya logical
+        line yang sedang diproses yang ditahan. Bentuk tambah(obj, v) baru
+        di-rewrite di AST stage (compile / transpile), tidak di output text ini.
+        """
+        self.stats['translations'] += 1
+        for _, translated, imports in self._iter_logical_lines(readline, stream_fallback=True):
+            yield translated, imports
+    
+    def translate_file(self, path: str, read_seconds: float = 0.0) -> tuple[str, set]:
+        """translate_code untuk file, dibaca streaming (source tidak utuh di memori)
+        
+        Dengan instrumentation, waktu open/readline dicatat sebagai stage
+        'read' dan sisanya sebagai 'translate' (keduanya interleaved).
+        `read_seconds` = waktu baca file sebelumnya (mis. hash key disk
+        cache), digabung ke sample 'read' yang sama.
+        """
+        if self.instrumentation is None:
+            return self._translate_file(path, None)
+        
+        streamed_read = [0.0]
+        start = time.perf_counter()
+        try:
+            return self._translate_file(path, streamed_read)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.instrumentation.record('read', path, read_seconds + streamed_read[0])
+            self.instrumentation.record('translate', path, elapsed - streamed_read[0])
+    
+    def _translate_file(self, path: str, read_seconds: Optional[list]) -> tuple[str, set]:
+        translated = []
+        imports = set()
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            readline = f.readline
+            if read_seconds is not None:
+                read_seconds[0] += time.perf_counter() - start
+                
+                def readline(f_readline=f.readline):
+                    line_start = time.perf_counter()
+                    try:
+                        return f_readline()
+                    finally:
+                        read_seconds[0] += time.perf_counter() - line_start
+            
+            for chunk, chunk_imports in self.translate_stream(readline):
+                translated.append(chunk)
+                imports.update(chunk_imports)
+        return ''.join(translated), imports
+    
+    def translate_incremental(self, previous: Optional['IncrementalTranslation'],
+                              code: str) -> 'IncrementalTranslation':
+        """Translate ulang hanya logical line yang berubah sejak `previous`
+        
+        Chunk sebelum baris pertama yang berubah dan setelah titik resync
+        (batas logical line di common suffix) dipakai ulang; hanya region
+        di antaranya yang di-tokenize. Hasil .code identik byte per byte
+        dengan translate_code(code).
+        """
+        self.stats['translations'] += 1
+        if previous is None or previous.states is None:
+            scope = _ClassScope()
+            chunks = []
+            states = [scope.snapshot()]
+            for chunk in self._iter_logical_lines(io.StringIO(code).readline, scope=scope):
+                chunks.append(chunk)
+                states.append(scope.snapshot())
+            return IncrementalTranslation(chunks, retranslated=len(chunks), states=states)
+        
+        old_lines = _split_lines(previous.source)
+        new_lines = _split_lines(code)
+        
+        # Common prefix/suffix dalam physical lines
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        if prefix == len(old_lines) == len(new_lines):
+            return IncrementalTranslation(previous.chunks, retranslated=0, states=previous.states)
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+        
+        # Head: chunk yang seluruhnya sebelum baris pertama yang berubah.
+        # Chunk terakhir tidak ikut: bisa jadi fallback dari source tidak lengkap
+        row = 0
+        head_count = 0
+        for source, _, _ in previous.chunks[:-1]:
+            line_count = _line_count(source)
+            if row + line_count > prefix:
+                break
+            row += line_count
+            head_count += 1
+        region_start = row
+        
+        # Tail: chunk lama yang seluruhnya di common suffix, per row baru
+        shift = len(new_lines) - len(old_lines)
+        suffix_start = len(old_lines) - suffix
+        tail_starts = {}
+        for index in range(head_count, len(previous.chunks)):
+            if row >= suffix_start:
+                tail_starts[row + shift] = index
+            row += _line_count(previous.chunks[index][0])
+        
+        # Region: tokenize dari batas chunk sampai resync dengan tail. Body
+        # class yang terbuka ikut dilanjutkan, dan tail hanya dipakai ulang
+        # jika state class di titik resync sama dengan translation lama
+        states = previous.states
+        scope = _ClassScope.restore(states[head_count])
+        remaining = iter(new_lines[region_start:])
+        region = []
+        region_states = []
+        resync = None
+        row = region_start
+        class_rows = []
+        for chunk in self._iter_logical_lines(lambda: next(remaining, ''), scope=scope, class_rows=class_rows):
+            region.append(chunk)
+            region_states.append(scope.snapshot())
+            if len(chunk[0]) <= MAX_CACHED_LINE_LENGTH and not class_rows:
+                self.line_cache.set(chunk[0], chunk[1:])
+            class_rows.clear()
+            row += _line_count(chunk[0])
+            if (row >= len(new_lines) - suffix and row in tail_starts
+                    and scope.snapshot() == states[tail_starts[row]]):
+                resync = tail_starts[row]
+                break
+        
+        chunks = previous.chunks[:head_count] + region
+        new_states = states[:head_count + 1] + region_states
+        if resync is not None:
+            chunks += previous.chunks[resync:]
+            new_states += states[resync + 1:]
+        return IncrementalTranslation(chunks, retranslated=len(region), states=new_states)
+    
+    def stage(self, stage: str, filename: str):
+        """Timing context untuk satu pipeline stage (no-op tanpa instrumentation)"""
+        if self.instrumentation is None:
+            return _NULL_STAGE
+        return self.instrumentation.stage(stage, filename)
+    
+    def compile_code(self, code: str, filename: str = '<pys>') -> tuple[types.CodeType, str, set]:
+        """Translate + compile ke code object dengan satu parse
+        
+        Token pass (line-preserving) -> ast.parse -> transformer ->
+        compile(tree). Required imports dari kedua stage digabung. Hasil
+        di-cache per source snippet sebagai bytes marshal (ukurannya terhitung
+        tepat di byte budget, tidak seperti AST); saat hit co_filename diganti
+        ke `filename` panggilan ini. Dengan thread_safe, snippet yang sama dari
+        beberapa thread sekaligus (execute_code, aexecute) hanya di-translate sekali.
+        """
+        cacheable = len(code) <= MAX_CACHED_SNIPPET_LENGTH
+        if self.thread_safe and cacheable:
+            # Single-flight: thread lain dengan snippet sama menunggu hasil ini
+            entry, computed = self.snippet_cache.get_or_compute(
+                code, lambda: self._prepare_snippet(code, filename))
+            if not computed:
+                self.stats['snippet_cache_hits'] += 1
         else:
-            # Use simple translation for basic cases
-            translated = self._simple_translation(line)
+            entry = self.snippet_cache.get(code, _MISSING) if cacheable else _MISSING
+            if entry is _MISSING:
+                entry = self._prepare_snippet(code, filename)
+                if cacheable:
+                    self.snippet_cache.set(code, entry)
+            else:
+                self.stats['snippet_cache_hits'] += 1
         
-        self.line_cache.set(line_hash, translated)
-        return translated
+        translated, imports, data = entry
+        with self.stage('compile', filename):
+            return _code_with_filename(marshal.loads(data), filename), translated, set(imports)
     
-    def translate_code(self, code: str) -> tuple[str, set]:
-        """Translate entire code block"""
-        lines = code.split('\n')
-        translated_lines = []
-        all_imports = set()
+    def _prepare_snippet(self, code: str, filename: str) -> tuple[str, frozenset, bytes]:
+        """Token pass + AST stage + compile untuk compile_code -> entry snippet_cache"""
+        with self.stage('translate', filename):
+            translated, imports = self.translate_code(code)
+        with self.stage('ast-transform', filename):
+            tree, ast_imports = self._ast_translation(translated, filename)
+        with self.stage('compile', filename):
+            data = marshal.dumps(compile(tree, filename, 'exec'))
+        return translated, frozenset(imports | ast_imports), data
+    
+    def compile_translated(self, translated: str, imports: set, filename: str = '<pys>') -> types.CodeType:
+        """AST stage + compile untuk hasil token pass (imports di-update in place)"""
+        with self.stage('ast-transform', filename):
+            tree, ast_imports = self._ast_translation(translated, filename)
+        imports.update(ast_imports)
+        with self.stage('compile', filename):
+            return compile(tree, filename, 'exec')
+    
+    def compile_line(self, translated: str, imports: frozenset = _NO_IMPORTS
+                     ) -> tuple[types.CodeType, bool, Optional[types.CodeType]]:
+        """Compile hasil translate_line dengan satu parse, di-cache per teks translated
+        
+        Return (code, is_expression, import_code). Satu expression statement
+        di-compile mode 'eval' supaya nilainya bisa dikembalikan, selain itu
+        'exec'. import_code (atau None) harus dijalankan sebelum code.
+        """
+        entry = self.ast_cache.get(translated, _MISSING)
+        if entry is not _MISSING:
+            self.stats['code_cache_hits'] += 1
+            return entry
+        
+        tree, ast_imports = self._ast_translation(translated)
+        body = tree.body
+        is_expression = len(body) == 1 and isinstance(body[0], ast.Expr)
+        if is_expression:
+            code = compile(ast.Expression(body[0].value), '<pys>', 'eval')
+        else:
+            code = compile(tree, '<pys>', 'exec')
+        
+        all_imports = imports | ast_imports
+        import_code = compile('\n'.join(sorted(all_imports)), '<pys>', 'exec') if all_imports else None
+        entry = (code, is_expression, import_code)
+        if len(translated) <= MAX_CACHED_LINE_LENGTH:
+            self.ast_cache.set(translated, entry)
+        return entry
+    
+    def get_stats(self) -> dict:
+        """Get performance statistics"""
+        stats = self.stats.copy()
+        total_requests = stats['cache_hits'] + stats['cache_misses']
+        hit_rate = (stats['cache_hits'] / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            **stats,
+            'hit_rate': f"{hit_rate:.1f}%",
+            'cache_size': len(self.line_cache),
+            'cache_bytes': self.line_cache.current_bytes,
+            'cache_evictions': self.line_cache.evictions,
+            'snippet_cache_size': len(self.snippet_cache),
+            **({'pipeline': self.instrumentation.summary()['stages']} if self.instrumentation else {})
+        }
+
+class VirtualModuleLoader:
+    """Load dan translate Indonesian Python modules"""
+    
+    def __init__(self, translator: SmartTranslator,
+                 disk_cache: Optional[PersistentTranslationCache] = None,
+                 max_modules: int = 100, max_module_bytes: Optional[int] = None,
+                 max_code_bytes: Optional[int] = 64 * 1024 * 1024):
+        self.translator = translator
+        self.disk_cache = disk_cache
+        # Module live (dibatasi) terpisah dari bytecode hasil translate:
+        # module yang ter-evict dibangun ulang dari code_cache tanpa translate
+        self.loaded_modules = ModuleRegistry(max_modules, max_module_bytes)
+        self.code_cache = MemoryAwareCache(max_size=max(max_modules * 10, 1000), max_bytes=max_code_bytes)
+        self.modules_rebuilt = 0
+        
+        # Watch mode: artifact incremental + module yang di-impor, per path
+        self.keep_translations = False
+        self.translations = {}
+        self.dependencies = {}
+    
+    def compile_file(self, module_path: str) -> tuple[str, set, types.CodeType]:
+        """Translate + compile file, lewat persistent cache jika tersedia
+        
+        Key cache di-hash per block dan source di-translate streaming,
+        jadi file .pys besar tidak pernah utuh di memori sebagai source.
+        Hash key dan baca source dicatat sebagai satu sample 'read' per file.
+        """
+        instrumentation = self.translator.instrumentation
+        try:
+            key = None
+            read_seconds = 0.0
+            if self.disk_cache is not None:
+                start = time.perf_counter()
+                key = self.disk_cache.make_file_key(module_path)
+                read_seconds = time.perf_counter() - start
+                cached = self.disk_cache.load(module_path, key)
+                if cached is not None:
+                    if instrumentation is not None:
+                        instrumentation.record('read', module_path, read_seconds)
+                    return cached
+            
+            if self.keep_translations:
+                # Hanya logical line yang berubah sejak translation terakhir
+                start = time.perf_counter()
+                with open(module_path, 'r', encoding='utf-8') as f:
+                    indo_code = f.read()
+                if instrumentation is not None:
+                    instrumentation.record('read', module_path, read_seconds + time.perf_counter() - start)
+                with self.translator.stage('translate', module_path):
+                    artifact = self.translator.translate_incremental(self.translations.get(module_path), indo_code)
+                self.translations[module_path] = artifact
+                python_code, imports = artifact.code, artifact.imports
+            else:
+                # Stage 'read' (termasuk hash key) dan 'translate' dicatat oleh translate_file
+                python_code, imports = self.translator.translate_file(module_path, read_seconds)
+        except FileNotFoundError:
+            raise ImportError(f"Cannot find module: {module_path}")
+        
+        code = self.translator.compile_translated(python_code, imports, module_path)
+        
+        if self.disk_cache is not None:
+            self.disk_cache.store(module_path, key, python_code, imports, code)
+        
+        return python_code, imports, code
+    
+    def exec_module(self, module: types.ModuleType):
+        """Translate + execute module.__file__ ke dalam namespace module"""
+        module_path = module.__file__
+        
+        # Translate module (atau ambil dari disk cache)
+        python_code, imports, code = self.compile_file(module_path)
+        # Marshal bytes: ukuran tepat untuk budget, lebih ringkas dari code object
+        self.code_cache.set(module_path, (tuple(sorted(imports)), marshal.dumps(code)))
+        
+        if self.keep_translations:
+            self.record_dependencies(module_path, code, module.__dict__.get('__package__'))
+        
+        self._run_code(module, imports, code)
+    
+    def _run_code(self, module: types.ModuleType, imports, code: types.CodeType):
+        """Execute required imports + translated code in module namespace"""
+        module_path = module.__file__
+        for imp in sorted(imports):
+            exec(imp, module.__dict__)
+        instrumentation = self.translator.instrumentation
+        if instrumentation is None:
+            exec(code, module.__dict__)
+        else:
+            instrumentation.execute(code, module.__dict__, filename=module_path)
+        
+        self.loaded_modules.set(module_path, module)
+    
+    def record_dependencies(self, module_path: str, code: types.CodeType, package: Optional[str]):
+        """Catat module yang di-impor oleh code (IMPORT_NAME, termasuk nested)"""
+        self.dependencies[module_path] = _imported_modules(code, package)
+    
+    def reload_order(self, changed_paths: List[str], module_names: Dict[str, str]) -> List[str]:
+        """Changed paths + semua dependent-nya, dependency lebih dulu
+        
+        module_names memetakan path -> nama module untuk path yang tidak
+        ada di loaded_modules (mis. '__main__').
+        """
+        names = dict(module_names)
+        for path, module in self.loaded_modules.items():
+            names[path] = module.__name__
+        
+        affected = set(changed_paths)
+        frontier = list(changed_paths)
+        while frontier:
+            changed_name = names.get(frontier.pop())
+            for path, imported in self.dependencies.items():
+                if path not in affected and changed_name in imported:
+                    affected.add(path)
+                    frontier.append(path)
+        
+        # Topological order dalam affected set (post-order DFS)
+        path_by_name = {names[path]: path for path in affected if path in names}
+        ordered, visited = [], set()
+        
+        def visit(path):
+            if path in visited:
+                return
+            visited.add(path)
+            for name in sorted(self.dependencies.get(path, ())):
+                if name in path_by_name:
+                    visit(path_by_name[name])
+            ordered.append(path)
+        
+        for path in sorted(affected):
+            visit(path)
+        return ordered
+    
+    def reload_module(self, module_path: str) -> types.ModuleType:
+        """Re-execute module yang sudah di-load, in place (seperti importlib.reload)"""
+        module = self.loaded_modules[module_path]
+        self.exec_module(module)
+        return module
+    
+    def load_module(self, module_path: str) -> types.ModuleType:
+        """Load dan translate module"""
+        module = self.loaded_modules.get(module_path)
+        if module is not None:
+            return module
         
-        for line in lines:
-            translated_line = self.translate_line(line)
-            translated_lines.append(translated_line)
+        # Create virtual module
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        module = types.ModuleType(module_name)
+        module.__file__ = module_path
         
-        # Try AST translation for the whole block untuk better import detection
         try:
-            full_translated = '\n'.join(translated_lines)
-            ast_translated, imports = self._ast_translation(full_translated)
-            all_imports.update(imports)
-            return ast_translated, all_imports
-        except:
-            return '\n'.join(translated_lines), all_imports
+            compiled = self.code_cache.get(module_path)
+            if compiled is not None:
+                # Module ter-evict: bangun ulang dari bytecode, tanpa translate
+                imports, code_bytes = compiled
+                self._run_code(module, imports, marshal.loads(code_bytes))
+                self.modules_rebuilt += 1
+            else:
+                self.exec_module(module)
+        except ImportError:
+            raise
+        except Exception as e:
+            raise ImportError(f"Error executing module {module_path}: {e}")
+        
+        return module
     
     def get_stats(self) -> dict:
-        """Get performance statistics"""
-        total_requests = self.stats['cache_hits'] + self.stats['cache_misses']
-        hit_rate = (self.stats['cache_hits'] / total_requests * 100) if total_requests > 0 else 0
-        
+        """Resident size registry module + code cache"""
+        registry = self.loaded_modules
         return {
-            **self.stats,
-            'hit_rate': f"{hit_rate:.1f}%",
-            'cache_size': len(self.line_cache.cache)
+            'modules_resident': len(registry.resident),
+            'modules_live': len(registry),
+            'module_bytes': registry.current_bytes,
+            'module_evictions': registry.evictions,
+            'modules_rebuilt': self.modules_rebuilt,
+            'module_code_size': len(self.code_cache),
+            'module_code_bytes': self.code_cache.current_bytes,
         }
 
-class VirtualModuleLoader:
-    """Load dan translate Indonesian Python modules"""
+class PysModuleLoader:
+    """importlib Loader yang menjalankan file .pys lewat VirtualModuleLoader
     
-    def __init__(self, translator: SmartTranslator):
-        self.translator = translator
-        self.loaded_modules = {}
-        self.module_cache = MemoryAwareCache(max_size=100)
+    Protocol loader cukup create_module/exec_module - sengaja tanpa base
+    importlib.abc supaya `import Pys` tidak ikut memuat importlib.resources.
+    """
     
-    def load_module(self, module_path: str) -> types.ModuleType:
-        """Load dan translate module"""
-        if module_path in self.loaded_modules:
-            return self.loaded_modules[module_path]
+    def __init__(self, module_loader: VirtualModuleLoader):
+        self.module_loader = module_loader
+    
+    def create_module(self, spec):
+        # Default module creation dari import system
+        return None
+    
+    def exec_module(self, module: types.ModuleType):
+        self.module_loader.exec_module(module)
+
+class PysModuleFinder:
+    """sys.meta_path finder untuk module dan package berekstensi .pys"""
+    
+    def __init__(self, module_loader: VirtualModuleLoader, search_paths: Optional[List[str]] = None):
+        self.loader = PysModuleLoader(module_loader)
+        # Top-level lookup hanya di search_paths (None = sys.path)
+        self.search_paths = search_paths
+    
+    def find_spec(self, fullname, path, target=None):
+        name = fullname.rpartition('.')[2]
+        if path is None:
+            path = self.search_paths if self.search_paths is not None else sys.path
+        
+        for entry in path:
+            entry = entry or os.getcwd()
+            package_dir = os.path.join(entry, name)
+            for extension in PYS_EXTENSIONS:
+                init_path = os.path.join(package_dir, '__init__' + extension)
+                if os.path.isfile(init_path):
+                    return importlib.util.spec_from_file_location(
+                        fullname, init_path, loader=self.loader,
+                        submodule_search_locations=[package_dir])
+                
+                module_path = os.path.join(entry, name + extension)
+                if os.path.isfile(module_path):
+                    return importlib.util.spec_from_file_location(
+                        fullname, module_path, loader=self.loader)
+        return None
+
+def find_project_sources(project_dir: str) -> List[str]:
+    """Semua file Pys dalam project: main file + file berekstensi .pys"""
+    sources = [
+        os.path.join(project_dir, main)
+        for main in PROJECT_MAIN_FILES
+        if os.path.isfile(os.path.join(project_dir, main))
+    ]
+    
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(
+            d for d in dirs
+            if d not in (CACHE_DIR_NAME, '__pycache__') and not d.startswith('.')
+        )
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if name.endswith(PYS_EXTENSIONS) and path not in sources:
+                sources.append(path)
+    return sources
+
+class ProjectWatcher:
+    """Polling watcher: stat setiap tick, hash hanya file yang mtime/size-nya berubah"""
+    
+    def __init__(self, project_dir: str):
+        self.project_dir = project_dir
+        # path -> (mtime_ns, size, sha256)
+        self.snapshot = {}
+        self.poll()
+    
+    def poll(self) -> List[str]:
+        """Path yang isinya berubah (atau baru) sejak poll sebelumnya"""
+        changed = []
+        current = {}
+        for path in find_project_sources(self.project_dir):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            
+            previous = self.snapshot.get(path)
+            if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                current[path] = previous
+                continue
+            
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).digest()
+            except OSError:
+                continue
+            current[path] = (stat.st_mtime_ns, stat.st_size, digest)
+            if previous is None or previous[2] != digest:
+                changed.append(path)
         
-        # Check cache
-        cached_module = self.module_cache.get(module_path)
-        if cached_module:
-            self.loaded_modules[module_path] = cached_module
-            return cached_module
+        first_poll = not self.snapshot
+        self.snapshot = current
+        return [] if first_poll else changed
+
+class ProjectBuilder:
+    """AOT build: project Pys -> tree .py/.pyc yang jalan tanpa runtime Pys
+    
+    Manifest (BUILD_MANIFEST_NAME) menyimpan hash setiap source sehingga
+    build berikutnya hanya menulis ulang file yang berubah; source map
+    (BUILD_SOURCEMAP_NAME) memetakan baris output ke baris source asli.
+    File .py biasa (bukan main file) disalin apa adanya.
+    """
+    
+    def __init__(self, translator: SmartTranslator, project_dir: str, output_dir: str):
+        self.translator = translator
+        self.project_dir = os.path.abspath(project_dir)
+        self.output_dir = os.path.abspath(output_dir)
+        self.manifest_path = os.path.join(self.output_dir, BUILD_MANIFEST_NAME)
+    
+    def _inside_output(self, path: str) -> bool:
+        return os.path.commonpath([self.output_dir, os.path.abspath(path)]) == self.output_dir
+    
+    def _plan(self) -> Dict[str, tuple[str, bool]]:
+        """rel source -> (rel output, translate?) untuk semua file yang dibangun"""
+        plan = {}
+        for path in find_project_sources(self.project_dir):
+            if self._inside_output(path):
+                continue
+            rel = os.path.relpath(path, self.project_dir)
+            output = os.path.splitext(rel)[0] + '.py'
+            plan[rel] = (output, True)
         
-        # Read original file
+        outputs = {output for output, _ in plan.values()}
+        for root, dirs, files in os.walk(self.project_dir):
+            dirs[:] = sorted(
+                d for d in dirs
+                if d not in (CACHE_DIR_NAME, '__pycache__') and not d.startswith('.')
+                and not self._inside_output(os.path.join(root, d))
+            )
+            for name in sorted(files):
+                rel = os.path.relpath(os.path.join(root, name), self.project_dir)
+                if name.endswith('.py') and rel not in plan and rel not in outputs:
+                    plan[rel] = (rel, False)
+        return plan
+    
+    def _load_manifest(self) -> dict:
+        import json
         try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                indo_code = f.read()
-        except FileNotFoundError:
-            raise ImportError(f"Cannot find module: {module_path}")
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {'map_version': None, 'files': {}}
+        if manifest.get('map_version') != self.translator.map_version:
+            # Translator berubah: semua output harus dibangun ulang
+            manifest['files'] = {}
+        return manifest
+    
+    def _remove_output(self, output: str):
+        path = os.path.join(self.output_dir, output)
+        for stale in (path, importlib.util.cache_from_source(path)):
+            if os.path.exists(stale):
+                os.unlink(stale)
+    
+    def _emit(self, rel: str, output: str, translate: bool) -> Optional[List[tuple[int, int, int]]]:
+        """Tulis satu output .py + .pyc, return segments source map (None untuk salinan)"""
+        import py_compile
+        source_path = os.path.join(self.project_dir, rel)
+        output_path = os.path.join(self.output_dir, output)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Translate module
-        python_code, imports = self.translator.translate_code(indo_code)
+        segments = None
+        if translate:
+            with open(source_path, 'r', encoding='utf-8') as f:
+                code = f.read()
+            python_code, segments = self.translator.transpile(code, source_path)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(python_code)
+        else:
+            with open(source_path, 'rb') as src, open(output_path, 'wb') as dst:
+                dst.write(src.read())
         
-        # Add required imports
-        if imports:
-            import_lines = '\n'.join(sorted(imports)) + '\n\n'
-            python_code = import_lines + python_code
+        py_compile.compile(output_path, doraise=True)
+        return segments
+    
+    def build(self) -> List[tuple[str, str, float]]:
+        """Build incremental: (rel source, status, detik) per file"""
+        import json
+        import py_compile
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        previous = manifest['files']
+        plan = self._plan()
+        files = {}
+        results = []
         
-        # Create virtual module
-        module_name = os.path.splitext(os.path.basename(module_path))[0]
-        module = types.ModuleType(module_name)
-        module.__file__ = module_path
+        for rel, (output, translate) in plan.items():
+            start = time.perf_counter()
+            try:
+                key = _hash_file(os.path.join(self.project_dir, rel)).hexdigest()
+            except OSError as e:
+                results.append((rel, f'error: {e}', time.perf_counter() - start))
+                continue
+            
+            entry = previous.get(rel)
+            if (entry is not None and entry['key'] == key and entry['output'] == output
+                    and os.path.exists(os.path.join(self.output_dir, output))):
+                files[rel] = entry
+                results.append((rel, 'unchanged', time.perf_counter() - start))
+                continue
+            
+            try:
+                segments = self._emit(rel, output, translate)
+            except (SyntaxError, UnicodeDecodeError, OSError, py_compile.PyCompileError) as e:
+                # Tidak masuk manifest: dicoba lagi di build berikutnya
+                results.append((rel, f'error: {e}', time.perf_counter() - start))
+                continue
+            files[rel] = {'key': key, 'output': output, 'segments': segments}
+            results.append((rel, 'built' if translate else 'copied', time.perf_counter() - start))
         
-        # Execute translated code in module namespace
-        try:
-            exec(python_code, module.__dict__)
-        except Exception as e:
-            raise ImportError(f"Error executing module {module_path}: {e}")
+        # Source yang sudah dihapus: buang output lamanya
+        for rel, entry in previous.items():
+            if rel not in plan:
+                self._remove_output(entry['output'])
+                results.append((rel, 'removed', 0.0))
         
-        # Cache dan store
-        self.module_cache.set(module_path, module)
-        self.loaded_modules[module_path] = module
+        manifest = {'map_version': self.translator.map_version, 'files': files}
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, sort_keys=True, separators=(',', ':'))
         
-        return module
+        sourcemap = {
+            'version': 1,
+            'project': self.project_dir,
+            # output -> source + [output_line, source_line, count]
+            'files': {
+                entry['output']: {'source': rel, 'segments': entry['segments']}
+                for rel, entry in sorted(files.items()) if entry['segments'] is not None
+            },
+        }
+        with open(os.path.join(self.output_dir, BUILD_SOURCEMAP_NAME), 'w', encoding='utf-8') as f:
+            json.dump(sourcemap, f, sort_keys=True, separators=(',', ':'))
+        return results
+
+# Batch di bawah ini lebih cepat di satu process daripada membayar startup pool
+BATCH_PARALLEL_MIN_ITEMS = 20000
+
+# Per-process translator untuk translate_many worker
+_batch_translator = None
+
+def _batch_translate_lines(lines: List[str]) -> List[tuple[str, frozenset, bool]]:
+    global _batch_translator
+    if _batch_translator is None:
+        _batch_translator = SmartTranslator()
+    return _batch_translator._translate_batch_lines(lines)
+
+def _batch_translate_snippets(snippets: List[str]) -> List[tuple[str, set]]:
+    global _batch_translator
+    if _batch_translator is None:
+        _batch_translator = SmartTranslator()
+    return _batch_translator._translate_batch_snippets(snippets)
+
+def _map_batch(worker: Callable[[list], list], items: list, workers: Optional[int],
+               local: Callable[[list], list]) -> list:
+    """Jalankan `local(items)`, atau bagi ke process pool jika batch cukup besar"""
+    if not workers or workers == 1 or len(items) < BATCH_PARALLEL_MIN_ITEMS:
+        return local(items)
+    from concurrent.futures import ProcessPoolExecutor
+    size = -(-len(items) // (workers * 4))
+    parts = [items[start:start + size] for start in range(0, len(items), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [entry for part in executor.map(worker, parts) for entry in part]
+
+# Per-process state untuk precompile worker (dibuat sekali oleh initializer)
+_precompile_loader = None
+
+def _init_precompile_worker(cache_dir: Optional[str]):
+    global _precompile_loader
+    translator = SmartTranslator()
+    disk_cache = PersistentTranslationCache(translator.map_version, cache_dir)
+    _precompile_loader = VirtualModuleLoader(translator, disk_cache)
+
+def _precompile_file(source_path: str) -> tuple[str, str, float]:
+    """Translate + compile satu file ke disk cache: (path, status, detik)"""
+    start = time.perf_counter()
+    try:
+        _precompile_loader.compile_file(source_path)
+        status = 'compiled'
+    except (ImportError, SyntaxError, UnicodeDecodeError) as e:
+        status = f'error: {e}'
+    return source_path, status, time.perf_counter() - start
+
+# Nomor snippet dibagi semua runtime: linecache juga satu per proses
+_SNIPPET_IDS = itertools.count(1)
+LINECACHE_MAX_SNIPPETS = 256
+_linecache_snippets = OrderedDict()
+_linecache_lock = threading.Lock()
+
+def _register_linecache(filename: str, source: str):
+    """Masukkan source snippet ke linecache, entry snippet tertua dibuang di atas limit"""
+    with _linecache_lock:
+        # mtime None: linecache.checkcache tidak membuang entry ini
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        _linecache_snippets[filename] = None
+        _linecache_snippets.move_to_end(filename)
+        while len(_linecache_snippets) > LINECACHE_MAX_SNIPPETS:
+            old_filename, _ = _linecache_snippets.popitem(last=False)
+            linecache.cache.pop(old_filename, None)
+
+def format_pys_traceback(error: BaseException) -> str:
+    """Traceback tanpa frame internal runtime (Pys.py)
+    
+    Baris source diambil lewat linecache, jadi untuk code Pys yang sudah
+    didaftarkan runtime (lihat PythonSimplerRuntime._register_error_sources)
+    yang tampil adalah baris Indonesia asli.
+    """
+    if isinstance(error, SyntaxError):
+        # Frame compile/ast.parse tidak relevan untuk user
+        return ''.join(traceback.format_exception_only(type(error), error))
+    
+    runtime_file = format_pys_traceback.__code__.co_filename
+    report = traceback.TracebackException.from_exception(error)
+    pending = [report]
+    while pending:
+        current = pending.pop()
+        frames = [frame for frame in current.stack if frame.filename != runtime_file]
+        for frame in frames:
+            if hasattr(frame, 'colno') and (frame.filename.endswith(PYS_EXTENSIONS)
+                                            or frame.filename.startswith('<pys')):
+                # Kolom (caret ^^^, Python 3.11+) menunjuk ke teks hasil translate
+                frame.colno = frame.end_colno = None
+        current.stack = traceback.StackSummary.from_list(frames)
+        pending.extend(chained for chained in (current.__cause__, current.__context__) if chained is not None)
+    return ''.join(report.format())
+
+class SnippetTimeout(BaseException):
+    """Dilempar di dalam snippet aexecute yang melewati timeout
+    
+    BaseException agar tidak tertangkap `except Exception` di kode user.
+    """
+
+def _cancel_trace(cancelled: threading.Event) -> Callable:
+    """Trace function yang menghentikan eksekusi saat `cancelled` di-set"""
+    def trace(frame, event, arg):
+        if cancelled.is_set():
+            raise SnippetTimeout("snippet dihentikan: timeout")
+        return trace
+    return trace
 
 class PythonSimplerRuntime:
     """Main runtime environment untuk Python Simpler"""
     
-    def __init__(self, debug: bool = False):
-        self.translator = SmartTranslator()
-        self.module_loader = VirtualModuleLoader(self.translator)
+    def __init__(self, debug: bool = False, use_disk_cache: bool = True,
+                 cache_dir: Optional[str] = None, thread_safe: bool = False):
+        # thread_safe=True untuk host multi-thread yang berbagi satu runtime
+        self.translator = SmartTranslator(thread_safe=thread_safe)
+        self.disk_cache = None
+        if use_disk_cache:
+            self.disk_cache = PersistentTranslationCache(self.translator.map_version, cache_dir)
+        self.module_loader = VirtualModuleLoader(self.translator, self.disk_cache)
+        self.import_finder = None
         self.debug = debug
+        # Snippet execute_code/aexecute di-compile dengan filename unik per
+        # proses (<pys-N>); source-nya baru masuk linecache jika terjadi error
+        self.snippet_sources = (ShardedMemoryCache if thread_safe else MemoryAwareCache)(max_size=256)
         self.execution_globals = {}
         self.execution_locals = {}
         
         # Setup built-in functions
         self._setup_builtins()
+        # Snapshot sebelum kode user jalan, basis namespace aexecute
+        self.base_globals = dict(self.execution_globals)
     
     def _setup_builtins(self):
         """Setup built-in functions untuk environment"""
-        # Handle __builtins__ yang bisa berupa module atau dict
-        if isinstance(__builtins__, dict):
-            self.execution_globals.update(__builtins__)
-        else:
-            # __builtins__ adalah module
-            self.execution_globals.update(__builtins__.__dict__)
-        
-        # Add custom Indonesian functions dengan error handling
-        modules_to_import = {
-            'statistik': 'statistics',
-            'sqlite3': 'sqlite3', 
-            'os': 'os',
-            'sys': 'sys',
-            'time': 'time',
-            'math': 'math',
-            'random': 'random',
-            'json': 'json',
-            're': 're',
-        }
+        # Referensi ke module builtins (lookup builtin tetap jalan), bukan copy dict
+        self.execution_globals['__builtins__'] = builtins
         
-        for alias, module_name in modules_to_import.items():
-            try:
-                self.execution_globals[alias] = __import__(module_name)
-            except ImportError:
-                if self.debug:
-                    print(f"Warning: Could not import {module_name}")
-                pass
+        # Alias module di-bind lazy: import baru terjadi saat attribute diakses
+        for alias, module_name in MODULE_ALIASES.items():
+            self.execution_globals[alias] = lazy_module(alias, module_name)
     
     def execute_line(self, line: str) -> Any:
-        """Execute single line"""
+        """Execute single line (atau satu block multi-line dari REPL)"""
         if not line.strip():
             return None
         
-        translated = self.translator.translate_line(line)
+        translated, imports = self.translator.translate_line_entry(line)
         
         if self.debug:
             print(f"Original: {line}")
             print(f"Translated: {translated}")
         
-        try:
-            # Use eval for expressions, exec for statements
-            if self._is_expression(translated):
-                result = eval(translated, self.execution_globals, self.execution_locals)
-                return result
-            else:
-                exec(translated, self.execution_globals, self.execution_locals)
-                return None
-        except Exception as e:
-            # Pass through original Python errors
-            raise e
+        # Satu parse + compile, code object di-cache per teks translated
+        code, is_expression, import_code = self.translator.compile_line(translated, imports)
+        if import_code is not None:
+            exec(import_code, self.execution_globals)
+        
+        # Use eval for expressions, exec for statements
+        if is_expression:
+            return eval(code, self.execution_globals, self.execution_locals)
+        exec(code, self.execution_globals, self.execution_locals)
+        return None
+    
+    def _snippet_filename(self, code: str) -> str:
+        """Filename unik untuk snippet; simpan referensi source untuk traceback"""
+        filename = f"<pys-{next(_SNIPPET_IDS)}>"
+        self.snippet_sources.set(filename, code)
+        return filename
+    
+    def _register_error_sources(self, error: BaseException):
+        """Isi linecache dengan source Pys asli untuk frame di traceback
+        
+        Token pass mempertahankan nomor baris (offset 0), jadi baris N code
+        object = baris N source asli. Hanya dipanggil di jalur error.
+        """
+        filenames = []
+        chain, seen = [error], set()
+        while chain:
+            current = chain.pop()
+            if current is None or id(current) in seen:
+                continue
+            seen.add(id(current))
+            tb = current.__traceback__
+            while tb is not None:
+                filenames.append(tb.tb_frame.f_code.co_filename)
+                tb = tb.tb_next
+            if isinstance(current, SyntaxError) and current.filename:
+                filenames.append(current.filename)
+            chain.extend((current.__cause__, current.__context__))
+        
+        for filename in filenames:
+            source = self.snippet_sources.get(filename)
+            if source is not None:
+                _register_linecache(filename, source)
+        
+        if isinstance(error, SyntaxError) and error.filename and error.lineno:
+            line = linecache.getline(error.filename, error.lineno)
+            if line and line.strip() != (error.text or '').strip():
+                # Kolom menunjuk ke teks hasil translate, tidak berlaku untuk baris asli
+                error.text, error.offset, error.end_offset = line, None, None
     
     def execute_code(self, code: str) -> Any:
         """Execute code block"""
-        translated_code, imports = self.translator.translate_code(code)
+        filename = self._snippet_filename(code)
+        try:
+            compiled, translated_code, imports = self.translator.compile_code(code, filename)
+        except SyntaxError as e:
+            self._register_error_sources(e)
+            raise
         
         # Add required imports
         if imports:
@@ -442,35 +2465,160 @@ class PythonSimplerRuntime:
             print("="*50)
         
         try:
-            exec(translated_code, self.execution_globals, self.execution_locals)
+            self._exec(compiled, filename, code)
         except Exception as e:
             if self.debug:
-                traceback.print_exc()
+                print(format_pys_traceback(e), end='', file=sys.stderr)
             raise e
     
+    def get_stats(self) -> dict:
+        """Stats translator + registry module"""
+        return {**self.translator.get_stats(), **self.module_loader.get_stats()}
+    
+    def new_namespace(self) -> dict:
+        """Namespace terisolasi: shallow copy base_globals (tanpa _setup_builtins)"""
+        namespace = self.base_globals.copy()
+        namespace['__name__'] = '__main__'
+        return namespace
+    
+    def _execute_isolated(self, code: str, namespace: dict,
+                          cancelled: Optional[threading.Event] = None) -> dict:
+        """Translate + compile + exec di `namespace` (dipanggil dari executor thread)"""
+        filename = self._snippet_filename(code)
+        try:
+            compiled, _, imports = self.translator.compile_code(code, filename)
+        except SyntaxError as e:
+            self._register_error_sources(e)
+            raise
+        for imp in imports:
+            exec(imp, namespace)
+        
+        if cancelled is None:
+            self._exec(compiled, filename, code, namespace)
+            return namespace
+        
+        # Trace hanya per thread ini; tracer sebelumnya (coverage, debugger)
+        # dipasang lagi sesudahnya karena thread dipakai ulang
+        previous_trace = sys.gettrace()
+        sys.settrace(_cancel_trace(cancelled))
+        try:
+            self._exec(compiled, filename, code, namespace)
+        finally:
+            sys.settrace(previous_trace)
+        return namespace
+    
+    async def aexecute(self, code: str, timeout: Optional[float] = None,
+                       executor: Optional[Any] = None) -> dict:
+        """Execute snippet tanpa blocking event loop, return namespace snippet
+        
+        Translate/compile/exec jalan di `executor` (default: executor loop)
+        dengan namespace sendiri, jadi banyak snippet aman berjalan bersamaan.
+        Untuk banyak thread sekaligus, buat runtime dengan thread_safe=True.
+        Jika `timeout` terlewati, asyncio.TimeoutError dilempar dan snippet
+        dihentikan lewat SnippetTimeout pada baris berikutnya yang dieksekusi.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        namespace = self.new_namespace()
+        if timeout is None:
+            return await loop.run_in_executor(executor, self._execute_isolated, code, namespace)
+        
+        cancelled = threading.Event()
+        future = loop.run_in_executor(executor, self._execute_isolated, code, namespace, cancelled)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            cancelled.set()
+            raise
+    
+    def install_import_hook(self, search_path: str) -> PysModuleFinder:
+        """Pasang finder .pys di sys.meta_path (sebelum PathFinder)"""
+        search_path = os.path.abspath(search_path)
+        
+        if self.import_finder is None:
+            self.import_finder = PysModuleFinder(self.module_loader, [])
+        if search_path not in self.import_finder.search_paths:
+            self.import_finder.search_paths.append(search_path)
+        
+        if self.import_finder not in sys.meta_path:
+            # Sebelum PathFinder agar package .pys tidak jadi namespace package
+            try:
+                position = sys.meta_path.index(importlib.machinery.PathFinder)
+            except ValueError:
+                position = len(sys.meta_path)
+            sys.meta_path.insert(position, self.import_finder)
+        
+        return self.import_finder
+    
+    def uninstall_import_hook(self):
+        """Lepas finder .pys dari sys.meta_path"""
+        if self.import_finder in sys.meta_path:
+            sys.meta_path.remove(self.import_finder)
+        self.import_finder = None
+    
     def execute_file(self, filepath: str):
         """Execute Indonesian Python file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                code = f.read()
+            # Module .pys di folder yang sama bisa di-impor (lazy)
+            self.install_import_hook(os.path.dirname(os.path.abspath(filepath)))
+            
+            # Translated source + bytecode, warm start lewat disk cache
+            translated_code, imports, code = self.module_loader.compile_file(filepath)
+            if self.module_loader.keep_translations:
+                self.module_loader.record_dependencies(filepath, code, None)
             
             # Set __file__ untuk proper imports
             self.execution_globals['__file__'] = os.path.abspath(filepath)
             self.execution_globals['__name__'] = '__main__'
             
-            self.execute_code(code)
+            for imp in imports:
+                exec(imp, self.execution_globals)
+            
+            if self.debug:
+                print("="*50)
+                print(f"TRANSLATED CODE ({filepath}):")
+                print(translated_code)
+                print("="*50)
+            
+            self._exec(code, filepath)
             
         except Exception as e:
+            self._register_error_sources(e)
             print(f"Error executing {filepath}: {e}")
-            if self.debug:
-                traceback.print_exc()
+            print(format_pys_traceback(e), end='', file=sys.stderr)
     
-    def _is_expression(self, code: str) -> bool:
-        """Check if code is expression or statement"""
+    def enable_instrumentation(self, profile: bool = False) -> PipelineInstrumentation:
+        """Aktifkan stage timing (dan optional cProfile) untuk runtime ini"""
+        self.translator.instrumentation = PipelineInstrumentation(profile=profile)
+        return self.translator.instrumentation
+    
+    def disable_instrumentation(self):
+        self.translator.instrumentation = None
+    
+    def _exec(self, code: types.CodeType, filename: str, source: Optional[str] = None,
+              namespace: Optional[dict] = None):
+        """exec di execution namespace (atau `namespace`), lewat instrumentation jika aktif"""
+        if namespace is None:
+            globals_, locals_ = self.execution_globals, self.execution_locals
+        else:
+            globals_ = locals_ = namespace
+        instrumentation = self.translator.instrumentation
+        try:
+            if instrumentation is None:
+                exec(code, globals_, locals_)
+            else:
+                instrumentation.execute(code, globals_, locals_, filename, source)
+        except BaseException as e:
+            self._register_error_sources(e)
+            raise
+    
+    def _is_incomplete(self, source: str) -> bool:
+        """True jika block REPL (tanpa newline akhir) masih butuh baris lanjutan"""
+        translated = self.translator.translate_line(source)
         try:
-            ast.parse(code, mode='eval')
-            return True
-        except SyntaxError:
+            return codeop.compile_command(translated, '<pys>', 'single') is None
+        except (SyntaxError, ValueError, OverflowError):
+            # Error dilaporkan saat block dieksekusi
             return False
     
     def interactive_mode(self):
@@ -478,25 +2626,44 @@ class PythonSimplerRuntime:
         print("🚀 Python Simpler Interactive Mode")
         print("Ketik 'keluar()' atau Ctrl+C untuk exit")
         print("Ketik 'stats()' untuk melihat performance stats")
+        print("Block (jika/untuk/def ...:) diakhiri dengan baris kosong")
         print("-" * 50)
         
+        block = []
         while True:
             try:
-                line = input(">>> ")
+                line = input("... " if block else ">>> ")
+                
+                if block:
+                    block.append(line)
+                    source = '\n'.join(block)
+                    if line.strip() and self._is_incomplete(source):
+                        continue
+                    block = []
+                    result = self.execute_line(source)
+                    if result is not None:
+                        print(result)
+                    continue
                 
                 if line.strip() in ['keluar()', 'exit()', 'quit()']:
                     break
                 elif line.strip() == 'stats()':
-                    stats = self.translator.get_stats()
+                    stats = self.get_stats()
                     for key, value in stats.items():
                         print(f"{key}: {value}")
                     continue
                 elif line.strip() == 'clear_cache()':
                     self.translator.cache.clear()
+                    self.translator.ast_cache.clear()
+                    self.translator.snippet_cache.clear()
                     self.translator.line_cache.clear()
                     print("Cache cleared!")
                     continue
                 
+                if line.strip() and self._is_incomplete(line):
+                    block = [line]
+                    continue
+                
                 result = self.execute_line(line)
                 if result is not None:
                     print(result)
@@ -509,17 +2676,17 @@ class PythonSimplerRuntime:
             except Exception as e:
                 print(f"Error: {e}")
     
-    def run_project(self, project_dir: str):
-        """Run entire project dengan multi-file support"""
-        main_file = None
-        
-        # Look for main file
-        possible_mains = ['main.py', 'app.py', 'run.py', '__main__.py']
-        for main in possible_mains:
+    def _find_main_file(self, project_dir: str) -> Optional[str]:
+        """Look for main file"""
+        for main in PROJECT_MAIN_FILES:
             main_path = os.path.join(project_dir, main)
             if os.path.exists(main_path):
-                main_file = main_path
-                break
+                return main_path
+        return None
+    
+    def run_project(self, project_dir: str):
+        """Run entire project dengan multi-file support"""
+        main_file = self._find_main_file(project_dir)
         
         if not main_file:
             print(f"No main file found in {project_dir}")
@@ -530,17 +2697,613 @@ class PythonSimplerRuntime:
         os.chdir(project_dir)
         
         try:
-            # Add project dir to path
+            # Add project dir to path, module .pys di-translate saat di-impor
             sys.path.insert(0, project_dir)
+            self.install_import_hook(project_dir)
+            self.execute_file(main_file)
+        finally:
+            os.chdir(old_cwd)
+            self.uninstall_import_hook()
+            if project_dir in sys.path:
+                sys.path.remove(project_dir)
+
+    def watch_project(self, project_dir: str, interval: float = 0.5, max_polls: Optional[int] = None):
+        """Run project lalu hot-reload module yang berubah beserta dependent-nya"""
+        project_dir = os.path.abspath(project_dir)
+        main_file = self._find_main_file(project_dir)
+        if not main_file:
+            print(f"No main file found in {project_dir}")
+            return
+        
+        loader = self.module_loader
+        loader.keep_translations = True
+        old_cwd = os.getcwd()
+        os.chdir(project_dir)
+        sys.path.insert(0, project_dir)
+        self.install_import_hook(project_dir)
+        
+        try:
             self.execute_file(main_file)
+            watcher = ProjectWatcher(project_dir)
+            print(f"👀 Watching {project_dir} (Ctrl+C untuk berhenti)")
+            
+            polls = 0
+            while max_polls is None or polls < max_polls:
+                time.sleep(interval)
+                polls += 1
+                changed = watcher.poll()
+                if changed:
+                    self.reload_changed(changed, main_file)
+        except KeyboardInterrupt:
+            print("\nWatch stopped")
         finally:
             os.chdir(old_cwd)
+            self.uninstall_import_hook()
+            loader.keep_translations = False
             if project_dir in sys.path:
                 sys.path.remove(project_dir)
+    
+    def reload_changed(self, changed_paths: List[str], main_file: str) -> List[str]:
+        """Reload module yang berubah + dependent-nya; main file dijalankan ulang"""
+        loader = self.module_loader
+        reloaded = []
+        for path in loader.reload_order(changed_paths, {main_file: '__main__'}):
+            start = time.perf_counter()
+            try:
+                if path == main_file:
+                    self.execute_file(main_file)
+                elif path in loader.loaded_modules:
+                    loader.reload_module(path)
+                else:
+                    # Belum pernah di-impor: tetap lazy
+                    continue
+            except Exception as e:
+                print(f"🔁 Reload gagal {os.path.basename(path)}: {e}")
+                continue
+            reloaded.append(path)
+            print(f"🔁 Reloaded {os.path.basename(path)} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return reloaded
+    
+    def build_project(self, project_dir: str, output_dir: Optional[str] = None) -> List[tuple[str, str, float]]:
+        """AOT transpile project ke tree .py/.pyc (default: <project>_build)"""
+        project_dir = os.path.abspath(project_dir)
+        output_dir = output_dir or project_dir.rstrip(os.sep) + '_build'
+        results = ProjectBuilder(self.translator, project_dir, output_dir).build()
+        
+        for rel, status, elapsed in results:
+            print(f"{elapsed * 1000:8.1f} ms  {status:<10} {rel}")
+        written = sum(1 for _, status, _ in results if status in ('built', 'copied'))
+        print(f"{written} written, {len(results) - written} unchanged/removed/error, "
+              f"total {sum(elapsed for _, _, elapsed in results) * 1000:.1f} ms -> {output_dir}")
+        return results
+    
+    def precompile_project(self, project_dir: str, workers: Optional[int] = None) -> List[tuple[str, str, float]]:
+        """Translate + compile semua file project ke disk cache secara paralel"""
+        if self.disk_cache is None:
+            print("Disk cache nonaktif, precompile tidak berguna")
+            return []
+        
+        results = []
+        stale = []
+        for source_path in find_project_sources(project_dir):
+            start = time.perf_counter()
+            try:
+                key = self.disk_cache.make_file_key(source_path)
+            except OSError as e:
+                results.append((source_path, f'error: {e}', time.perf_counter() - start))
+                continue
+            
+            if self.disk_cache.is_fresh(source_path, key):
+                results.append((source_path, 'cached', time.perf_counter() - start))
+            else:
+                stale.append(source_path)
+        
+        cache_dir = self.disk_cache.cache_dir
+        if len(stale) > 1 and workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_precompile_worker,
+                                     initargs=(cache_dir,)) as executor:
+                results.extend(executor.map(_precompile_file, stale))
+        elif stale:
+            _init_precompile_worker(cache_dir)
+            results.extend(_precompile_file(path) for path in stale)
+        
+        for source_path, status, elapsed in results:
+            print(f"{elapsed * 1000:8.1f} ms  {status:<10} {os.path.relpath(source_path, project_dir)}")
+        compiled = sum(1 for _, status, _ in results if status == 'compiled')
+        print(f"{compiled} compiled, {len(results) - compiled} skipped/error, "
+              f"total {sum(elapsed for _, _, elapsed in results) * 1000:.1f} ms")
+        
+        return results
+
+class ZygoteResult(NamedTuple):
+    """Hasil satu eksekusi di worker zygote"""
+    ok: bool
+    output: str
+    error: Optional[str]
+    seconds: float
+
+def _read_fd(fd: int) -> bytes:
+    chunks = []
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+def _write_fd(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+class _ZygoteWorker:
+    """Proses hasil fork yang menunggu satu snippet (sekali pakai)"""
+    __slots__ = ('pid', 'job_fd', 'result_fd', 'started')
+    
+    def __init__(self, pid: int, job_fd: int, result_fd: int):
+        self.pid = pid
+        self.job_fd = job_fd
+        self.result_fd = result_fd
+        self.started = 0.0
+
+class ZygotePool:
+    """Prefork pool: worker di-fork dari runtime yang sudah warm (copy-on-write)
+    
+    Runtime template menyimpan cache translasi yang sudah terisi dan module
+    alias yang sudah di-import; setiap worker mewarisi semuanya lewat fork,
+    menjalankan tepat satu snippet di namespace baru lalu exit. Worker
+    cadangan di-fork lebih dulu, jadi eksekusi tidak menunggu startup.
+    Hanya untuk platform dengan os.fork, dan jangan dipakai bersama thread
+    lain yang aktif (fork hanya menyalin thread pemanggil). Sebelum fork
+    pertama heap proses di-gc.freeze dan tetap frozen setelah close().
+    """
+    
+    def __init__(self, runtime: Optional['PythonSimplerRuntime'] = None, size: Optional[int] = None,
+                 warmup: Optional[List[str]] = None):
+        if not hasattr(os, 'fork'):
+            raise RuntimeError("ZygotePool butuh os.fork (Linux/macOS)")
+        self.runtime = runtime or PythonSimplerRuntime(use_disk_cache=False)
+        self.size = size or os.cpu_count() or 1
+        self.idle = []
+        self.stats = {'spawned': 0, 'spawn_seconds': 0.0, 'executions': 0, 'timeouts': 0, 'failed': 0}
+        self._frozen = False
+        self._warm(warmup or ())
+    
+    def _warm(self, snippets):
+        """Isi snippet_cache translator + import module alias sebelum fork pertama
+        
+        Worker yang menerima snippet hasil warmup hanya perlu load code dari cache.
+        """
+        translator = self.runtime.translator
+        for snippet in snippets:
+            try:
+                translator.compile_code(snippet)
+            except SyntaxError:
+                pass
+        for value in self.runtime.base_globals.values():
+            if isinstance(value, LazyModule):
+                dir(value)
+    
+    def _freeze(self):
+        """gc.freeze tepat sebelum fork pertama: page template tetap shared setelah fork
+        
+        Tidak di-unfreeze di close(): gc.unfreeze tidak selektif dan akan ikut
+        melepas freeze milik kode lain. Object yang frozen tetap dibebaskan
+        lewat refcount, hanya tidak di-scan cycle GC lagi.
+        """
+        if self._frozen:
+            return
+        gc.collect()
+        gc.freeze()
+        self._frozen = True
+    
+    def _spawn(self) -> _ZygoteWorker:
+        self._freeze()
+        start = time.perf_counter()
+        job_read, job_write = os.pipe()
+        result_read, result_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                os.close(job_write)
+                os.close(result_read)
+                # fd milik worker lain tidak boleh tertahan di child ini
+                for worker in self.idle:
+                    os.close(worker.job_fd)
+                    os.close(worker.result_fd)
+                self._serve(job_read, result_write)
+                status = 0
+            finally:
+                os._exit(status)
+        
+        os.close(job_read)
+        os.close(result_write)
+        self.stats['spawned'] += 1
+        self.stats['spawn_seconds'] += time.perf_counter() - start
+        return _ZygoteWorker(pid, job_write, result_read)
+    
+    def _serve(self, job_fd: int, result_fd: int):
+        """Sisi child: baca snippet sampai EOF, execute, kirim hasil JSON"""
+        import json
+        code = _read_fd(job_fd).decode('utf-8')
+        os.close(job_fd)
+        if not code:
+            # Pool ditutup sebelum worker dipakai
+            return
+        
+        sys.stdin = io.StringIO()
+        output = io.StringIO()
+        error = None
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                self.runtime._execute_isolated(code, self.runtime.new_namespace())
+        except BaseException as e:
+            error = ''.join(traceback.format_exception_only(type(e), e)).strip()
+        payload = {'output': output.getvalue(), 'error': error, 'seconds': time.perf_counter() - start}
+        _write_fd(result_fd, json.dumps(payload).encode('utf-8'))
+        os.close(result_fd)
+    
+    def _fill(self):
+        while len(self.idle) < self.size:
+            self.idle.append(self._spawn())
+    
+    def start(self) -> 'ZygotePool':
+        """Fork worker cadangan sampai `size`"""
+        self._fill()
+        return self
+    
+    def _submit(self, code: str) -> _ZygoteWorker:
+        worker = self.idle.pop() if self.idle else self._spawn()
+        worker.started = time.perf_counter()
+        _write_fd(worker.job_fd, code.encode('utf-8'))
+        os.close(worker.job_fd)
+        return worker
+    
+    def _collect(self, worker: _ZygoteWorker, timed_out: bool) -> ZygoteResult:
+        import json
+        import signal
+        if timed_out:
+            os.kill(worker.pid, signal.SIGKILL)
+            data = b''
+        else:
+            data = _read_fd(worker.result_fd)
+        os.close(worker.result_fd)
+        os.waitpid(worker.pid, 0)
+        elapsed = time.perf_counter() - worker.started
+        
+        self.stats['executions'] += 1
+        if timed_out:
+            self.stats['timeouts'] += 1
+            return ZygoteResult(False, '', 'timeout', elapsed)
+        if not data:
+            self.stats['failed'] += 1
+            return ZygoteResult(False, '', 'worker exit tanpa hasil', elapsed)
+        payload = json.loads(data)
+        if payload['error'] is not None:
+            self.stats['failed'] += 1
+        return ZygoteResult(payload['error'] is None, payload['output'], payload['error'], payload['seconds'])
+    
+    def execute_many(self, snippets: List[str], timeout: Optional[float] = None) -> List[ZygoteResult]:
+        """Jalankan snippet paralel (maks `size` sekaligus), hasil urut seperti input"""
+        import select
+        results = [None] * len(snippets)
+        pending = iter(enumerate(snippets))
+        running = {}
+        for index, code in pending:
+            worker = self._submit(code)
+            running[worker.result_fd] = (index, worker)
+            if len(running) >= self.size:
+                break
+        
+        while running:
+            deadline = None
+            if timeout is not None:
+                oldest = min(worker.started for _, worker in running.values())
+                deadline = max(0.0, oldest + timeout - time.perf_counter())
+            ready, _, _ = select.select(list(running), [], [], deadline)
+            
+            finished = [(fd, False) for fd in ready]
+            if not ready:
+                now = time.perf_counter()
+                finished = [(fd, True) for fd, (_, worker) in running.items()
+                            if now - worker.started >= timeout]
+            for fd, timed_out in finished:
+                index, worker = running.pop(fd)
+                results[index] = self._collect(worker, timed_out)
+                for next_index, code in pending:
+                    next_worker = self._submit(code)
+                    running[next_worker.result_fd] = (next_index, next_worker)
+                    break
+        
+        self._fill()
+        return results
+    
+    def execute(self, code: str, timeout: Optional[float] = None) -> ZygoteResult:
+        """Jalankan satu snippet di worker baru hasil fork"""
+        return self.execute_many([code], timeout)[0]
+    
+    def close(self):
+        """Hentikan worker cadangan (EOF tanpa snippet = exit); heap tetap frozen"""
+        for worker in self.idle:
+            os.close(worker.job_fd)
+            os.close(worker.result_fd)
+            os.waitpid(worker.pid, 0)
+        self.idle = []
+    
+    def __enter__(self) -> 'ZygotePool':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class PipelineBenchmark:
+    """Benchmark harness untuk translation/execution pipeline (subcommand 'bench')"""
+    
+    SIZES = (100, 1000, 10000)
+    DENSITIES = (0.1, 0.5, 0.9)
+    
+    # Baris yang banyak memakai keyword Indonesia vs baris Python polos
+    KEYWORD_TEMPLATES = (
+        'nilai_{i} = panjang(daftar([{i}, 2, 3])) + maksimum({i}, 4)',
+        'jika {i} % 2 == 0 dan benar: hasil_{i} = bulat({i} / 3)',
+        'untuk j dalam rentang(2): tmp_{i} = absolut(j - {i})',
+        'teks_{i} = ke_teks({i}) jika tidak salah selain_itu kosong',
+    )
+    PLAIN_TEMPLATES = (
+        'plain_{i} = {i} * 3 + 1',
+        'pair_{i} = ({i}, "teks dalam string")',
+    )
+    
+    def __init__(self, sizes=None, densities=None, repeat: int = 3, seed: int = 0):
+        self.sizes = tuple(sizes or self.SIZES)
+        self.densities = tuple(densities or self.DENSITIES)
+        self.repeat = repeat
+        self.seed = seed
+    
+    def generate_corpus(self, line_count: int, density: float) -> str:
+        """Source Pys valid (bisa dieksekusi) dengan proporsi baris keyword = density"""
+        import random
+        rng = random.Random(f"{self.seed}:{line_count}:{density}")
+        lines = []
+        for i in range(line_count):
+            templates = self.KEYWORD_TEMPLATES if rng.random() < density else self.PLAIN_TEMPLATES
+            lines.append(rng.choice(templates).format(i=i))
+        return '\n'.join(lines) + '\n'
+    
+    def _best_time(self, func: Callable[[], Any], setup: Optional[Callable[[], Any]] = None) -> float:
+        """Waktu terbaik dari `repeat` kali; setup (tidak diukur) dipanggil tiap run"""
+        best = float('inf')
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    def _measure_stages(self, code: str, workdir: str) -> Dict[str, tuple[float, float]]:
+        """stage -> (cold seconds, warm seconds)"""
+        lines = code.splitlines()
+        translated, _ = SmartTranslator().translate_code(code)
+        module_path = os.path.join(workdir, 'bench_module.pys')
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write(code)
+        
+        state = {}
+        
+        def fresh_translator():
+            state['translator'] = SmartTranslator()
+        
+        def fresh_loader():
+            translator = SmartTranslator()
+            state['cache'] = PersistentTranslationCache(translator.map_version, workdir)
+            state['loader'] = VirtualModuleLoader(translator, state['cache'])
+        
+        def cold_loader():
+            fresh_loader()
+            cache_file = state['cache'].entry_path(module_path)
+            if os.path.exists(cache_file):
+                os.unlink(cache_file)
+        
+        def fresh_runtime():
+            state['runtime'] = PythonSimplerRuntime(use_disk_cache=False)
+        
+        stages = {
+            'translate_line': lambda: [state['translator'].translate_line(line) for line in lines],
+            '_simple_translation': lambda: [state['translator']._simple_translation(line) for line in lines],
+            '_ast_translation': lambda: state['translator']._ast_translation(translated),
+            'translate_code': lambda: state['translator'].translate_code(code),
+            'load_module': lambda: state['loader'].load_module(module_path),
+            'execute_code': lambda: state['runtime'].execute_code(code),
+        }
+        
+        results = {}
+        for stage, func in stages.items():
+            if stage == 'load_module':
+                cold = self._best_time(func, cold_loader)
+                # Warm: disk cache terisi, loader baru (seperti proses baru)
+                func()
+                warm = self._best_time(func, fresh_loader)
+            elif stage == 'execute_code':
+                cold = self._best_time(func, fresh_runtime)
+                warm = self._best_time(func)
+            else:
+                cold = self._best_time(func, fresh_translator)
+                warm = self._best_time(func)
+            results[stage] = (cold, warm)
+        return results
+    
+    def run(self, progress: bool = True) -> dict:
+        """Jalankan semua corpus, hasil dalam bentuk dict JSON-serializable"""
+        import platform
+        import tempfile
+        results = {}
+        with tempfile.TemporaryDirectory(prefix='pys-bench-') as workdir:
+            for size in self.sizes:
+                for density in self.densities:
+                    code = self.generate_corpus(size, density)
+                    for stage, timings in self._measure_stages(code, workdir).items():
+                        for mode, seconds in zip(('cold', 'warm'), timings):
+                            key = f"{stage}:{mode}:{size}x{density}"
+                            results[key] = {
+                                'seconds': seconds,
+                                'lines_per_sec': size / seconds if seconds else None,
+                            }
+                    if progress:
+                        print(f"  corpus {size} lines, density {density} done", file=sys.stderr)
+        
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'translator_version': TRANSLATOR_VERSION,
+                'repeat': self.repeat,
+            },
+            'results': results,
+        }
+    
+    @staticmethod
+    def compare(current: dict, baseline: dict, threshold: float = 0.2) -> List[tuple[str, float, float]]:
+        """Regressions: (key, baseline seconds, current seconds) yang > (1 + threshold)x"""
+        regressions = []
+        for key, entry in current['results'].items():
+            base = baseline.get('results', {}).get(key)
+            if base is None or not base['seconds']:
+                continue
+            if entry['seconds'] > base['seconds'] * (1 + threshold):
+                regressions.append((key, base['seconds'], entry['seconds']))
+        return regressions
+
+def run_benchmark_cli(argv: List[str]) -> int:
+    """bench [--quick] [--output FILE] [--baseline FILE] [--threshold 0.2]"""
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(prog='Pys.py bench', description='Benchmark pipeline Pys')
+    parser.add_argument('--quick', action='store_true', help='corpus kecil saja (100/1000 baris)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='tulis hasil JSON ke file (default: stdout)')
+    parser.add_argument('--baseline', help='bandingkan dengan hasil JSON tersimpan')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='toleransi regresi relatif (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+    
+    benchmark = PipelineBenchmark(sizes=(100, 1000) if args.quick else None, repeat=args.repeat)
+    report = benchmark.run()
+    
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = PipelineBenchmark.compare(report, baseline, args.threshold)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms "
+                  f"({after / before:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions vs baseline", file=sys.stderr)
+    return 0
+
+def _is_prologue_chunk(text: str, first_statement: bool) -> bool:
+    """Chunk yang harus tetap sebelum import tambahan: kosong, comment,
+    docstring module (statement pertama) atau from __future__ import"""
+    stripped = text.strip()
+    if not stripped or stripped.startswith('#'):
+        return True
+    try:
+        body = ast.parse(text).body
+    except SyntaxError:
+        return False
+    if len(body) != 1:
+        return False
+    statement = body[0]
+    if isinstance(statement, ast.ImportFrom):
+        return statement.module == '__future__'
+    return (first_statement and isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Constant) and isinstance(statement.value.value, str))
+
+def run_translate_cli(argv: List[str]) -> int:
+    """translate [FILE] [--output FILE] [--no-header] - streaming, memori terbatas
+    
+    Bentuk fungsi bebas tambah(obj, v) butuh seluruh module untuk
+    di-resolve (lihat IndonesianTransformer), jadi dibiarkan di output
+    streaming ini; pakai `build` (transpile) untuk Python yang pasti mandiri.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='Pys.py translate',
+        description='Translate Pys ke Python secara streaming (default stdin -> stdout)',
+        epilog='Fungsi bebas seperti tambah(daftar, x) tidak di-rewrite jadi method call; '
+               'output seperti itu butuh runtime Pys. Gunakan "build" untuk output mandiri.')
+    parser.add_argument('source', nargs='?', help='file .pys (default: stdin)')
+    parser.add_argument('--output', help='tulis hasil ke file (default: stdout)')
+    parser.add_argument('--no-header', action='store_true',
+                        help='tanpa baris import module (output tetap sejajar baris input)')
+    args = parser.parse_args(argv)
+    
+    translator = SmartTranslator()
+    # Import baru diketahui setelah seluruh source lewat, jadi header berisi
+    # semua module target dotted (statistics.mean, sqlite3.connect, ...) dan
+    # alias yang di runtime tersedia sebagai global (statistik, json, ...)
+    header = ''
+    if not args.no_header:
+        modules = {target.split('.')[0] for target in translator.function_map.values() if '.' in target}
+        modules.update(module_name for alias, module_name in MODULE_ALIASES.items() if alias == module_name)
+        names = sorted(modules) + [f"{module_name} as {alias}" for alias, module_name in sorted(MODULE_ALIASES.items())
+                                   if alias != module_name]
+        header = f"import {', '.join(names)}  # Pys: module dotted dan alias runtime\n"
+    
+    source = open(args.source, 'r', encoding='utf-8') if args.source else sys.stdin
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        # Docstring dan from __future__ ditahan dulu supaya header tetap valid
+        prologue = []
+        first_statement = True
+        for chunk, _ in translator.translate_stream(source.readline):
+            if prologue is not None:
+                if _is_prologue_chunk(chunk, first_statement):
+                    prologue.append(chunk)
+                    if chunk.strip() and not chunk.lstrip().startswith('#'):
+                        first_statement = False
+                    continue
+                output.write(''.join(prologue) + header)
+                prologue = None
+            output.write(chunk)
+        if prologue is not None:
+            output.write(''.join(prologue))
+    finally:
+        if args.source:
+            source.close()
+        if args.output:
+            output.close()
+    return 0
 
 def main():
     """Main entry point"""
-    runtime = PythonSimplerRuntime(debug=True)
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        sys.exit(run_benchmark_cli(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'translate':
+        sys.exit(run_translate_cli(sys.argv[2:]))
+    
+    # Default quiet; --debug mencetak source asli + hasil translate setiap eksekusi
+    debug = '--debug' in sys.argv
+    if debug:
+        sys.argv.remove('--debug')
+    runtime = PythonSimplerRuntime(debug=debug)
+    
+    # --profile: stage timings + cProfile per baris source asli
+    instrumentation = None
+    if '--profile' in sys.argv:
+        sys.argv.remove('--profile')
+        instrumentation = runtime.enable_instrumentation(profile=True)
     
     if len(sys.argv) > 1:
         if sys.argv[1] == 'interactive':
@@ -550,6 +3313,24 @@ def main():
                 runtime.run_project(sys.argv[2])
             else:
                 print("Usage: python main.py project <project_directory>")
+        elif sys.argv[1] == 'watch':
+            if len(sys.argv) > 2:
+                interval = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+                runtime.watch_project(sys.argv[2], interval)
+            else:
+                print("Usage: python main.py watch <project_directory> [interval]")
+        elif sys.argv[1] == 'build':
+            if len(sys.argv) > 2:
+                output_dir = sys.argv[3] if len(sys.argv) > 3 else None
+                runtime.build_project(sys.argv[2], output_dir)
+            else:
+                print("Usage: python main.py build <project_directory> [output_directory]")
+        elif sys.argv[1] == 'precompile':
+            if len(sys.argv) > 2:
+                workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+                runtime.precompile_project(sys.argv[2], workers)
+            else:
+                print("Usage: python main.py precompile <project_directory> [workers]")
         else:
             # Execute file
             runtime.execute_file(sys.argv[1])
@@ -598,9 +3379,12 @@ cetak("\\n=== SELESAI ===")
         
         print("\n" + "="*50)
         print("PERFORMANCE STATS:")
-        stats = runtime.translator.get_stats()
+        stats = runtime.get_stats()
         for key, value in stats.items():
             print(f"{key}: {value}")
+    
+    if instrumentation is not None:
+        instrumentation.print_report()
 
 if __name__ == "__main__":
     main()
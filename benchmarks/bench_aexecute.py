@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Throughput aexecute: banyak snippet pendek via asyncio.gather dibanding
+execute_code sinkron satu per satu, plus biaya clone namespace dan
+snippet yang dihentikan oleh timeout.
+
+    python benchmarks/bench_aexecute.py [jumlah_snippet] [concurrency]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Pys import PythonSimplerRuntime
+
+
+def generate_snippets(count, seed=7):
+    """Snippet pendek ala user submission (sebagian baris berulang)"""
+    rng = random.Random(seed)
+    templates = [
+        "angka = [{a}, {b}, {c}]\nskor = jumlah(angka) + maksimum(angka)\n",
+        "teks = 'data-{a}'\nskor = panjang(teks.upper())\n",
+        "skor = 0\nuntuk i dalam jangkauan({a}):\n    jika i % 2 == 0:\n        skor += i\n",
+        "def kali(x):\n    kembalikan x * {b}\nskor = kali({c})\n",
+    ]
+    return [rng.choice(templates).format(a=rng.randint(1, 50), b=rng.randint(1, 9), c=rng.randint(1, 99))
+            for _ in range(count)]
+
+
+def run_sync(runtime, snippets):
+    start = time.perf_counter()
+    for snippet in snippets:
+        runtime.execute_code(snippet)
+    return time.perf_counter() - start
+
+
+async def run_async(runtime, snippets, concurrency, timeout=None):
+    semaphore = asyncio.Semaphore(concurrency)
+    timeouts = 0
+
+    async def one(snippet):
+        nonlocal timeouts
+        async with semaphore:
+            try:
+                await runtime.aexecute(snippet, timeout=timeout)
+            except asyncio.TimeoutError:
+                timeouts += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(snippet) for snippet in snippets))
+    return time.perf_counter() - start, timeouts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    snippets = generate_snippets(count)
+
+    sync_time = run_sync(PythonSimplerRuntime(use_disk_cache=False), snippets)
+
+    runtime = PythonSimplerRuntime(use_disk_cache=False, thread_safe=True)
+    async_time, _ = asyncio.run(run_async(runtime, snippets, concurrency))
+    timeout_time, _ = asyncio.run(run_async(runtime, snippets, concurrency, timeout=5.0))
+
+    runaway = ["selama benar:\n    lewati\n"] * concurrency
+    runaway_time, timeouts = asyncio.run(run_async(runtime, runaway, concurrency, timeout=0.05))
+
+    start = time.perf_counter()
+    for _ in range(count):
+        runtime.new_namespace()
+    clone_us = (time.perf_counter() - start) / count * 1e6
+
+    print(f"{count} snippet, concurrency {concurrency}")
+    print(f"execute_code (sync, shared globals): {count / sync_time:10,.0f} snippet/detik")
+    print(f"aexecute (isolated namespace):       {count / async_time:10,.0f} snippet/detik")
+    print(f"aexecute + timeout (trace aktif):    {count / timeout_time:10,.0f} snippet/detik")
+    print(f"clone namespace:                     {clone_us:10.1f} us/snippet")
+    print(f"{timeouts}/{len(runaway)} snippet infinite loop dihentikan dalam {runaway_time:.2f} detik")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark hit path translate_line: md5 key + truthiness check (lama) vs
+direct string key + sentinel (baru), dalam nanodetik per baris.
+
+    python benchmarks/bench_line_cache.py [jumlah_baris_unik] [putaran]
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Pys import MemoryAwareCache, SmartTranslator
+from bench_simple_translation import generate_source
+
+
+class LegacyLineCache:
+    """Hit path lama: md5 setiap baris, 'if cached:' sebagai hit test"""
+
+    def __init__(self, translator):
+        self.translator = translator
+        self.line_cache = MemoryAwareCache(max_size=10000)
+
+    def translate_line(self, line):
+        if not line.strip() or line.strip().startswith('#'):
+            return line
+        line_hash = hashlib.md5(line.encode()).hexdigest()
+        cached = self.line_cache.get(line_hash)
+        if cached:
+            return cached
+        translated = self.translator._simple_translation(line)
+        self.line_cache.set(line_hash, translated)
+        return translated
+
+
+def measure(translate_line, lines, rounds):
+    for line in lines:
+        translate_line(line)  # warm up: semua baris masuk cache
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for line in lines:
+            translate_line(line)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(lines)) * 1e9
+
+
+def main():
+    unique = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    lines = list(dict.fromkeys(generate_source(unique * 2)))[:unique]
+
+    translator = SmartTranslator()
+    old_ns = measure(LegacyLineCache(translator).translate_line, lines, rounds)
+    new_ns = measure(translator.translate_line, lines, rounds)
+
+    print(f"{len(lines)} baris unik x {rounds} putaran (semua cache hit)")
+    print(f"lama (md5 key):    {old_ns:8.0f} ns/baris")
+    print(f"baru (string key): {new_ns:8.0f} ns/baris")
+    print(f"speedup:           {old_ns / new_ns:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark _simple_translation: per-keyword re.sub loop (lama) vs compiled
+single-pass matcher (baru), dalam lines/sec pada source 10k-100k baris.
+
+    python benchmarks/bench_simple_translation.py [jumlah_baris ...]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Pys import SmartTranslator
+
+TEMPLATES = [
+    'cetak("Halo", {w})',
+    'untuk i dalam rentang({n}):',
+    '    jika i % 2 == 0 dan {w} > {n}:',
+    '        {w} = panjang(daftar_{w}) + jumlah(angka)',
+    '    selain_itu:',
+    '        kembalikan rata_rata({w})',
+    'data = kamus({{"nama": "Alice", "umur": {n}}})',
+    'teks_{w} = huruf_besar(pisah(teks, " "))',
+    'hasil_{w} = maksimum(angka) atau minimum(angka)',
+    '# komentar {w} dalam baris',
+]
+
+
+def legacy_simple_translation(function_map, line):
+    """Implementasi lama: sort + satu re.sub per keyword, per baris"""
+    translated = line
+    sorted_functions = sorted(function_map.items(), key=lambda x: len(x[0]), reverse=True)
+    for indo_word, python_word in sorted_functions:
+        pattern = r'\b' + re.escape(indo_word) + r'\b'
+        translated = re.sub(pattern, python_word, translated)
+    return translated
+
+
+def generate_source(line_count, seed=0):
+    rng = random.Random(seed)
+    words = ['nilai', 'total', 'x', 'data', 'item', 'skor', 'ini', 'kunci']
+    return [
+        rng.choice(TEMPLATES).format(w=rng.choice(words), n=rng.randint(1, 100))
+        for _ in range(line_count)
+    ]
+
+
+def measure(func, lines):
+    start = time.perf_counter()
+    output = [func(line) for line in lines]
+    elapsed = time.perf_counter() - start
+    return output, len(lines) / elapsed
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 50000, 100000]
+    translator = SmartTranslator()
+
+    print(f"{'lines':>8} {'old lines/s':>14} {'new lines/s':>14} {'speedup':>9}")
+    for size in sizes:
+        lines = generate_source(size)
+        old_output, old_rate = measure(
+            lambda line: legacy_simple_translation(translator.function_map, line), lines)
+        new_output, new_rate = measure(translator._simple_translation, lines)
+        # Sejak KeywordIndex, output sengaja berbeda: tanpa chaining
+        # (statistics.statistics.mean) dan method hanya sebagai obj.kata(
+        changed = sum(old != new for old, new in zip(old_output, new_output))
+        print(f"{size:>8} {old_rate:>14,.0f} {new_rate:>14,.0f} {new_rate / old_rate:>8.1f}x"
+              f"  ({changed} baris beda dari implementasi lama)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Startup time: konstruksi PythonSimplerRuntime + menjalankan file .pys kosong.
+
+Setiap skenario jalan di interpreter baru dengan `python -X importtime`;
+output-nya diringkas jadi total waktu import dan module termahal. Skenario
+"eager" mensimulasikan _setup_builtins lama (import semua alias langsung,
+copy dict builtins) sebagai pembanding.
+
+    python benchmarks/bench_startup.py [putaran] [top_n]
+"""
+
+import os
+import py_compile
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIO = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import Pys
+imported = time.perf_counter()
+runtime = Pys.PythonSimplerRuntime(use_disk_cache=False)
+if {eager}:
+    import builtins
+    runtime.execution_globals.update(builtins.__dict__)
+    for alias in ('statistik', 'sqlite3', 'os', 'sys', 'time', 'math', 'random', 'json', 're'):
+        dir(runtime.execution_globals[alias])
+constructed = time.perf_counter()
+runtime.execute_file({empty!r})
+done = time.perf_counter()
+print(imported - start, constructed - imported, done - constructed)
+"""
+
+
+def parse_importtime(stderr):
+    """-X importtime -> list (self_us, cumulative_us, module)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def run_scenario(empty_file, eager):
+    code = SCENARIO.format(root=ROOT, empty=empty_file, eager=eager)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    import_s, construct_s, run_s = map(float, result.stdout.split()[-3:])
+    return wall, import_s, construct_s, run_s, parse_importtime(result.stderr)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    # Pastikan .pyc Pys.py fresh (PYTHONDONTWRITEBYTECODE bisa mencegah import menulisnya)
+    py_compile.compile(os.path.join(ROOT, 'Pys.py'))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        empty_file = os.path.join(tmp, 'kosong.pys')
+        open(empty_file, 'w').close()
+
+        for label, eager in (('lazy (sekarang)', False), ('eager (lama)', True)):
+            # Ambil run tercepat (noise dari disk cache OS / scheduler)
+            runs = sorted((run_scenario(empty_file, eager) for _ in range(rounds)), key=lambda run: run[0])
+            wall, import_s, construct_s, run_s, rows = runs[0]
+            total_import_us = sum(row[0] for row in rows)
+
+            print(f"== {label} ==")
+            print(f"  proses total:        {wall * 1000:8.1f} ms")
+            print(f"  import Pys:          {import_s * 1000:8.1f} ms")
+            print(f"  PythonSimplerRuntime:{construct_s * 1000:8.1f} ms")
+            print(f"  execute_file kosong: {run_s * 1000:8.1f} ms")
+            print(f"  total import (self): {total_import_us / 1000:8.1f} ms, {len(rows)} module")
+            print(f"  top {top_n} module (self us | cumulative us):")
+            for self_us, cumulative_us, name in sorted(rows, reverse=True)[:top_n]:
+                print(f"    {self_us:8d} | {cumulative_us:10d} | {name.strip()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark translate_many vs loop translate_code: total baris naik, baris
+unik tetap. translate_many seharusnya mengikuti jumlah baris unik, loop
+biasa mengikuti total baris.
+
+    python benchmarks/bench_translate_many.py [jumlah_snippet ...] [--workers N]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Pys import SmartTranslator
+from bench_simple_translation import generate_source
+
+
+def generate_snippets(count, unique_lines=2000, seed=3):
+    """Snippet 3-12 baris dari pool baris terbatas (seperti jawaban latihan)"""
+    rng = random.Random(seed)
+    pool = list(dict.fromkeys(generate_source(unique_lines * 3)))[:unique_lines]
+    return ['\n'.join(rng.choice(pool) for _ in range(rng.randint(3, 12))) + '\n'
+            for _ in range(count)]
+
+
+def best_of(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        index = args.index('--workers')
+        workers = int(args[index + 1])
+        del args[index:index + 2]
+    counts = [int(arg) for arg in args] or [1000, 5000, 20000]
+
+    print(f"{'snippet':>8} {'baris':>8} {'unik':>6} {'loop lines/s':>14} {'batch lines/s':>14} {'speedup':>8}")
+    for count in counts:
+        snippets = generate_snippets(count)
+        total_lines = sum(snippet.count('\n') for snippet in snippets)
+        unique = len({line for snippet in snippets for line in snippet.splitlines()})
+
+        # Translator baru per putaran: tidak ada cache yang terbawa
+        loop_time = best_of(lambda: [SmartTranslator().translate_code(s) for s in snippets], repeat=1)
+        batch_time = best_of(lambda: SmartTranslator().translate_many(snippets, workers))
+        print(f"{count:>8} {total_lines:>8} {unique:>6} {total_lines / loop_time:>14,.0f} "
+              f"{total_lines / batch_time:>14,.0f} {loop_time / batch_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Spawn latency dan eksekusi/detik: ZygotePool (fork dari runtime warm)
+dibanding runtime baru per snippet, in-process dan di interpreter baru.
+
+    python benchmarks/bench_zygote.py [jumlah_snippet] [pool_size]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Pys import PythonSimplerRuntime, ZygotePool
+from bench_aexecute import generate_snippets
+
+SUBPROCESS_SCENARIO = """
+import sys
+sys.path.insert(0, {root!r})
+from Pys import PythonSimplerRuntime
+PythonSimplerRuntime(use_disk_cache=False).execute_code({code!r})
+"""
+
+
+def per_snippet(func, snippets):
+    """(rata-rata ms per snippet, snippet/detik)"""
+    start = time.perf_counter()
+    for snippet in snippets:
+        func(snippet)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(snippets) * 1000, len(snippets) / elapsed
+
+
+def fresh_runtime(snippet):
+    PythonSimplerRuntime(use_disk_cache=False).execute_code(snippet)
+
+
+def fresh_interpreter(snippet):
+    subprocess.run([sys.executable, '-c', SUBPROCESS_SCENARIO.format(root=ROOT, code=snippet)],
+                   check=True, capture_output=True)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    snippets = generate_snippets(count)
+
+    print(f"{count} snippet, pool size {size}")
+    print(f"{'mode':<36} {'ms/snippet':>11} {'snippet/detik':>14}")
+
+    ms, rate = per_snippet(fresh_interpreter, snippets[:20])
+    print(f"{'interpreter baru (subprocess)':<36} {ms:>11.2f} {rate:>14,.0f}")
+    ms, rate = per_snippet(fresh_runtime, snippets)
+    print(f"{'PythonSimplerRuntime baru (no isolasi)':<36} {ms:>11.2f} {rate:>14,.0f}")
+
+    with ZygotePool(size=size, warmup=snippets) as pool:
+        spawn_ms = pool.stats['spawn_seconds'] / pool.stats['spawned'] * 1000
+
+        # Satu per satu: worker cadangan sudah siap, refill setelah hasil diterima
+        ms, rate = per_snippet(pool.execute, snippets)
+        print(f"{'zygote execute (berurutan)':<36} {ms:>11.2f} {rate:>14,.0f}")
+
+        start = time.perf_counter()
+        results = pool.execute_many(snippets)
+        elapsed = time.perf_counter() - start
+        print(f"{'zygote execute_many (paralel)':<36} {elapsed / count * 1000:>11.2f} {count / elapsed:>14,.0f}")
+
+        failed = [result.error for result in results if not result.ok]
+        print(f"spawn (fork) worker: {spawn_ms:.2f} ms rata-rata, {pool.stats['spawned']} worker")
+        print(f"eksekusi di worker: {sum(r.seconds for r in results) / count * 1000:.2f} ms rata-rata, "
+              f"{len(failed)} gagal{': ' + failed[0] if failed else ''}")
+
+
+if __name__ == '__main__':
+    main()
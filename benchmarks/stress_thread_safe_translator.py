@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Stress test SmartTranslator(thread_safe=True): banyak thread menerjemahkan
+baris yang sama secara bersamaan.
+
+Yang dicek:
+  - single-flight: setiap baris unik diterjemahkan tepat satu kali
+  - tidak ada exception (termasuk eviction saat cache kecil dan penuh)
+  - cache_hits + cache_misses == jumlah panggilan (tidak ada lost update)
+  - hasil identik dengan translator single-thread
+
+    python benchmarks/stress_thread_safe_translator.py [threads] [putaran]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Pys import SmartTranslator
+from bench_simple_translation import generate_source
+
+
+def hammer(translator, lines, thread_count, rounds):
+    """Jalankan semua thread serentak; return (hasil per thread, errors, detik)"""
+    barrier = threading.Barrier(thread_count)
+    results = [None] * thread_count
+    errors = []
+
+    def worker(index):
+        # Urutan berbeda per thread supaya miss dan eviction saling bertabrakan
+        ordered = lines[index % len(lines):] + lines[:index % len(lines)]
+        output = {}
+        try:
+            barrier.wait()
+            for _ in range(rounds):
+                for line in ordered:
+                    output[line] = translator.translate_line(line)
+        except BaseException as e:
+            errors.append(e)
+        results[index] = output
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors, time.perf_counter() - start
+
+
+def check(name, condition, detail=''):
+    print(f"  [{'OK' if condition else 'GAGAL'}] {name}{' - ' + detail if detail else ''}")
+    return condition
+
+
+def main():
+    thread_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    lines = [line for line in dict.fromkeys(generate_source(4000))
+             if line.strip() and not line.strip().startswith('#')][:1000]
+    expected = {line: SmartTranslator().translate_line(line) for line in lines}
+    total_calls = thread_count * rounds * len(lines)
+
+    # Switch interval kecil = lebih banyak interleaving antar thread
+    sys.setswitchinterval(1e-6)
+    passed = True
+
+    print(f"{thread_count} thread x {rounds} putaran x {len(lines)} baris unik")
+
+    print("cache besar (single-flight):")
+    translator = SmartTranslator(thread_safe=True)
+    results, errors, elapsed = hammer(translator, lines, thread_count, rounds)
+    stats = translator.get_stats()
+    passed &= check("tanpa exception", not errors, repr(errors[:1]) if errors else '')
+    passed &= check("translasi tepat sekali per baris", stats['translations'] == len(lines),
+                    f"{stats['translations']} translasi untuk {len(lines)} baris")
+    passed &= check("counter konsisten", stats['cache_hits'] + stats['cache_misses'] == total_calls,
+                    f"{stats['cache_hits']} hit + {stats['cache_misses']} miss vs {total_calls} panggilan")
+    passed &= check("hasil identik", all(result == expected for result in results))
+    print(f"  {total_calls / elapsed:,.0f} baris/detik")
+
+    print("cache kecil (eviction di bawah kontensi):")
+    translator = SmartTranslator(thread_safe=True)
+    translator.line_cache = type(translator.line_cache)(max_size=64)
+    results, errors, elapsed = hammer(translator, lines, thread_count, rounds)
+    stats = translator.get_stats()
+    passed &= check("tanpa exception", not errors, repr(errors[:1]) if errors else '')
+    passed &= check("counter konsisten", stats['cache_hits'] + stats['cache_misses'] == total_calls)
+    passed &= check("cache dalam budget", stats['cache_size'] <= 64, f"{stats['cache_evictions']} eviction")
+    passed &= check("hasil identik", all(result == expected for result in results))
+    print(f"  {total_calls / elapsed:,.0f} baris/detik")
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Regression test: program Pys yang harus tetap jalan dengan output yang
+sama lewat execute_code (AST stage), transpile (Python mandiri) dan
+CLI translate (streaming, dijalankan tanpa runtime).
+
+    python -m pytest tests
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Pys import PythonSimplerRuntime, SmartTranslator
+
+# (nama, source Pys, output yang diharapkan, output CLI translate jalan mandiri)
+CASES = [
+    ("method bernama kata builtin (total -> sum)", """
+kelas Toko:
+    diskon = 1
+    total = 0
+    def __init__(diri):
+        diri.isi = [2, 3]
+    def total(diri):
+        kembalikan jumlah(diri.isi) - diri.diskon
+t = Toko()
+cetak(t.total(), Toko.diskon)
+def total(x):
+    kembalikan panjang(x)
+cetak(total([1, 2]))
+""", "4 1\n2\n", True),
+    ("method bernama kata method (tambah -> append)", """
+kelas Keranjang:
+    def pakai(diri):
+        diri.tambah(1)
+    def __init__(diri):
+        diri.isi = []
+    def tambah(diri, x):
+        diri.isi.append(x * 10)
+k = Keranjang()
+k.tambah(5)
+k.pakai()
+cetak(k.isi)
+""", "[50, 10]\n", True),
+    # Bentuk fungsi bebas butuh seluruh module, tidak di-rewrite CLI translate
+    ("method call builtin tetap di-translate", """
+angka = [3, 1]
+angka.tambah(2)
+tambah(angka, 4)
+cetak(angka, "a-b".pisah("-"))
+""", "[3, 1, 2, 4] ['a', 'b']\n", False),
+    ("atribut class dipakai di body class", """
+kelas A:
+    total = 3
+    dobel = total * 2
+cetak(A.dobel, A.total)
+""", "6 3\n", True),
+    ("variable item/nilai di samping d.item()", """
+d = {"a": 1}
+untuk item dalam d.item():
+    cetak(item)
+def simpan(nilai, data):
+    kembalikan list(data.nilai()) + list(data.kunci())
+cetak(simpan(0, d))
+""", "('a', 1)\n[1, 'a']\n", True),
+    ("method call dan alias module di output CLI translate", """
+angka = [1]
+angka.tambah(3)
+cetak(angka, statistik.median(angka))
+""", "[1, 3] 2.0\n", True),
+]
+
+
+def run(execute):
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            execute()
+    except Exception as e:
+        return f"{output.getvalue()}{type(e).__name__}: {e}\n"
+    return output.getvalue()
+
+
+def run_python(python_code):
+    return run(lambda: exec(compile(python_code, '<translated>', 'exec'), {'__name__': '__main__'}))
+
+
+def cases(standalone_only=False):
+    return [pytest.param(source, expected, id=name)
+            for name, source, expected, standalone in CASES
+            if standalone or not standalone_only]
+
+
+@pytest.mark.parametrize('source, expected', cases())
+def test_execute_code(source, expected):
+    runtime = PythonSimplerRuntime(use_disk_cache=False)
+    assert run(lambda: runtime.execute_code(source)) == expected
+
+
+@pytest.mark.parametrize('source, expected', cases())
+def test_transpile(source, expected):
+    python_code, _ = SmartTranslator().transpile(source)
+    assert run_python(python_code) == expected
+
+
+@pytest.mark.parametrize('source, expected', cases(standalone_only=True))
+def test_translate_cli(source, expected):
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'Pys.py'), 'translate'],
+                            input=source, capture_output=True, text=True, check=True)
+    assert run_python(result.stdout) == expected